@@ -7,5 +7,8 @@ setup(
     author="Joe Fusaro",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
-    python_requires=">=3.7"
+    python_requires=">=3.7",
+    extras_require={
+        "numpy": ["numpy"],
+    }
 )
\ No newline at end of file
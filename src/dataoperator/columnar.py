@@ -0,0 +1,123 @@
+from collections.abc import Mapping, Sequence
+
+
+def _is_datetime64(column) -> bool:
+    dtype = getattr(column, 'dtype', None)
+    return dtype is not None and dtype.kind == 'M'
+
+
+def _datetime64_getter(column):
+    # only microsecond datetime64 values convert to datetimes; e.g. ns values become ints
+    # and day values become dates, neither of which the timestamp parsers accept
+    return lambda index: column[index].astype('datetime64[us]').item()
+
+
+class RowView(Mapping):
+    """
+    A read/write view of one row of a `ColumnarRecords`; behaves like the record
+    dict it stands in for without copying the row out of its columns.
+    """
+
+    __slots__ = ('_records', 'index')
+
+    def __init__(self, records: "ColumnarRecords", index: int):
+        self._records = records
+        self.index = index
+
+    def __getitem__(self, field):
+        return self._records._getters[field](self.index)
+
+    def __setitem__(self, field, value):
+        # NumPy would silently cast (and truncate) values to the column's dtype
+        assert self._records.writable(field), f"Field '{field}' is not a list or object array column and cannot be written to"
+        self._records.columns[field][self.index] = value
+
+    def __contains__(self, field):
+        return field in self._records.columns
+
+    def __iter__(self):
+        return iter(self._records.columns)
+
+    def __len__(self):
+        return len(self._records.columns)
+
+    def __repr__(self):
+        return f"RowView({self.index}, {dict(self)!r})"
+
+
+class ColumnarRecords(Sequence):
+    """
+    Column-oriented records; `columns` maps field name -> list or NumPy array, all of
+    the same length. Can be passed anywhere a `lod` is accepted, e.g.
+
+        lod = ColumnarRecords({"id": ids, "age": numpy.array(ages)})
+        DataOperator(field_type="number", operator_type="merge_values", lod=lod, field="age", operator="keep_max_value")
+
+    Iterating yields a `RowView` per row instead of building a dict, and
+    select_master_record methods return the surviving row indexes rather than records.
+    Values read from NumPy arrays are returned as Python scalars.
+    """
+
+    def __init__(self, columns: dict):
+        assert isinstance(columns, Mapping) and columns, "columns must map field names to lists or arrays"
+        lengths = set(len(column) for column in columns.values())
+        assert len(lengths) == 1, "all columns must have the same length"
+
+        self.columns = dict(columns)
+        self._length = lengths.pop()
+        # ndarray.item returns Python scalars rather than NumPy ones
+        self._getters = {
+            field: _datetime64_getter(column) if _is_datetime64(column)
+            else column.item if hasattr(column, 'item') else column.__getitem__
+            for field, column in self.columns.items()
+        }
+
+    @classmethod
+    def from_lod(cls, lod: list) -> "ColumnarRecords":
+        """ Build columns from a list of dicts which all have the same keys. """
+        assert lod, "lod must contain at least one record"
+        return cls({field: [record[field] for record in lod] for field in lod[0]})
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RowView(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return RowView(self, index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield RowView(self, index)
+
+    def __repr__(self):
+        return f"ColumnarRecords({len(self)} rows, fields={list(self.columns)})"
+
+    def column(self, field: str):
+        """ The column (list or array) stored for `field`. """
+        return self.columns[field]
+
+    def writable(self, field: str) -> bool:
+        """ Whether `field` is a list or object-dtype array column, which hold any value as-is. """
+        column = self.columns.get(field)
+        if column is None:
+            return False
+        dtype = getattr(column, 'dtype', None)
+        return dtype is None or dtype.kind == 'O'
+
+    def values(self, field: str) -> list:
+        """
+        The values of `field` as a list of Python objects; lists are returned as-is, not
+        copied. datetime64 columns of any unit are returned as datetimes (None for NaT).
+        """
+        column = self.columns[field]
+        if _is_datetime64(column):
+            column = column.astype('datetime64[us]')
+        return column.tolist() if hasattr(column, 'tolist') else column
+
+    def to_lod(self) -> list:
+        return [dict(row) for row in self]
@@ -1,8 +1,9 @@
-import inspect
-from datetime import datetime
+import random
 
-from dataoperator.free_email_domains import FREE_EMAIL_DOMAINS
-from dataoperator.disposable_email_domains import DISPOSABLE_EMAIL_DOMAINS
+from dataoperator import vectorized
+from dataoperator.columnar import ColumnarRecords
+from dataoperator.email_domains import CORPORATE, classify_email, email_domain
+from dataoperator.timestamps import to_epoch_microseconds
 
 METHODS_BY_OPERATOR_TYPE = {
     'evaluate_condition': [
@@ -42,7 +43,8 @@ METHODS_BY_OPERATOR_TYPE = {
         'keep_record_with_min_value',
         'keep_record_with_newest_value',
         'keep_record_with_oldest_value',
-        'keep_record_with_highest_priority'
+        'keep_record_with_highest_priority',
+        'keep_record_by_criteria',
     ],
     'match_condition': [
         'matches',
@@ -72,6 +74,7 @@ METHODS_BY_FIELD_TYPE = {
         'keep_oldest_value',
         'concatenate_all_values',
         'preserve_priority',
+        'keep_record_by_criteria',
         'set_string',
         'append_string',
         'prepend_string',
@@ -117,6 +120,7 @@ METHODS_BY_FIELD_TYPE = {
         'keep_newest_value',
         'keep_oldest_value',
         'preserve_priority',
+        'keep_record_by_criteria',
         'set_string',
         'matches',
         'update_if_blank',
@@ -133,6 +137,7 @@ METHODS_BY_FIELD_TYPE = {
         'keep_oldest_value',
         'keep_record_with_max_value',
         'keep_record_with_min_value',
+        'keep_record_by_criteria',
         # 'increment',
         # 'decrement',
         'update_if_blank',
@@ -143,6 +148,7 @@ METHODS_BY_FIELD_TYPE = {
         'keep_oldest_value',
         'keep_record_with_newest_value',
         'keep_record_with_oldest_value',
+        'keep_record_by_criteria',
     ],
     'phone': [
         'equals',
@@ -168,6 +174,28 @@ METHODS_BY_FIELD_TYPE = {
     ],
 }
 
+# How thoroughly `lod` is checked before an operator runs:
+# - strict: every record is checked (default)
+# - sampled: at most VALIDATION_SAMPLE_SIZE randomly chosen records are checked
+# - trusted: records are not checked (e.g. data already validated upstream)
+# In sampled and trusted modes, a bad record that breaks an operator is re-checked
+# with strict validation so that it surfaces as the same AssertionError.
+VALIDATION_LEVELS = ('strict', 'sampled', 'trusted')
+VALIDATION_SAMPLE_SIZE = 32
+
+# fields checked (in order) for a record's created date when no `datetime_field` is given
+CREATED_DATETIME_FIELDS = ('createddate', 'created_at', 'createdat')
+
+# rules accepted by keep_record_by_criteria; each maps a value to a key where larger is better
+CRITERIA_RULES = ('max', 'min', 'newest', 'oldest', 'priority')
+
+# fields which keep_corporate_domain checks for a website / domain or company name that
+# corroborates one of the cluster's corporate email domains
+CORROBORATING_FIELDS = ('website', 'domain', 'account_domain', 'company', 'account_name')
+
+# merge methods which pick a record by `datetime_field` (or an auto-detected created date)
+_DATETIME_FIELD_METHODS = ('keep_newest_value', 'keep_oldest_value')
+
 FIELD_TYPE_MAP = {
     'reference': 'id',
     'number': 'int',
@@ -185,17 +213,142 @@ FIELD_TYPE_MAP = {
     'lead_function': 'string', # specific to Marketo; this is a formula field that can reference other fields in the same record, but ultimately it returns string values
 }
 
+def find_created_datetime_field(record: dict) -> str:
+    """ Return the first of CREATED_DATETIME_FIELDS present in `record`. """
+    for field in CREATED_DATETIME_FIELDS:
+        if field in record:
+            return field
+    raise ValueError("No datetime field found")
+
+
+def _criterion_key(value, rule: str, priority: list = None, parse=to_epoch_microseconds) -> tuple:
+    """
+    Comparison key for one keep_record_by_criteria criterion; a larger key is better
+    and a blank (or, for max / min, non-numeric) value loses to any other value.
+    """
+    if value in ['', None]:
+        return (0, 0)
+    if rule == 'max':
+        return (1, value) if isinstance(value, (int, float)) else (0, 0)
+    if rule == 'min':
+        return (1, -value) if isinstance(value, (int, float)) else (0, 0)
+    if rule == 'newest':
+        return (1, parse(value))
+    if rule == 'oldest':
+        return (1, -parse(value))
+    return (1, -priority.index(value)) if value in priority else (0, 0)
+
+
+def is_corporate_email(email: str, tenant=None) -> bool:
+    """ True if the domain of `email` is neither a free nor a disposable email domain (for `tenant`, if given). """
+    return classify_email(email, tenant=tenant) == CORPORATE
+
+
+def _corroboration_score(email: str, domains: set, company_keys: set) -> int:
+    """
+    2 if the email's registrable domain is a known website / domain, plus 1 if its name
+    is a company name (a canonical company name without spaces; see `canonical_company_name`).
+    """
+    from dataoperator.normalize import registrable_domain
+    domain = registrable_domain(email)
+    if domain is None:
+        return 0
+    score = 2 if domain in domains else 0
+    if domain.split('.', 1)[0].replace('-', '') in company_keys:
+        score += 1
+    return score
+
+
+def select_corporate_email(lod: list, field: str, tenant=None, fields: tuple = CORROBORATING_FIELDS) -> str:
+    """
+    The corporate email in `field` best corroborated by the rest of the cluster: in one
+    pass over `lod`, corporate candidates are collected along with the domains and
+    company names found in `fields` (e.g. a website of "https://www.bigcorp.co/about" or
+    a company of "BigCorp"), then each distinct candidate domain is scored once. Ties,
+    and clusters without any corroborating values, fall back to the first candidate;
+    returns None if no record has a corporate email.
+    """
+    from dataoperator.normalize import canonical_company_name, registrable_domain
+    candidates = []
+    domains = set()
+    company_keys = set()
+    for record in lod:
+        email = record.get(field)
+        if isinstance(email, str) and email and is_corporate_email(email, tenant):
+            candidates.append(email)
+        for other in fields:
+            value = record.get(other)
+            if not isinstance(value, str) or not value:
+                continue
+            domain = registrable_domain(value)
+            if domain:
+                domains.add(domain)
+            else:
+                key = canonical_company_name(value)
+                if key:
+                    company_keys.add(key.replace(' ', ''))
+
+    if not candidates:
+        return None
+    if not domains and not company_keys:
+        return candidates[0]
+
+    best, best_score = candidates[0], 0
+    scores = {}
+    for email in candidates:
+        domain = email_domain(email)
+        score = scores.get(domain)
+        if score is None:
+            score = scores[domain] = _corroboration_score(email, domains, company_keys)
+        if score > best_score:
+            best, best_score = email, score
+    return best
+
+
+def _register_methods(cls):
+    """
+    Build the method lookup tables for a DataOperator class at import time:
+    - `_dispatch_table` maps each operator name to its (unbound) method
+    - `_method_registry` maps (field_type, operator_type) to the methods allowed for that pair
+
+    Subclasses get their own tables (see `__init_subclass__`), so overridden
+    or newly implemented methods are picked up.
+    """
+    operator_names = sorted({name for names in METHODS_BY_OPERATOR_TYPE.values() for name in names})
+    cls._dispatch_table = {
+        name: getattr(cls, name) for name in operator_names
+        if callable(getattr(cls, name, None))
+    }
+    cls._method_registry = {
+        (field_type, operator_type): {
+            name: method for name, method in cls._dispatch_table.items()
+            if name in operator_methods and name in field_methods
+        }
+        for field_type, field_methods in METHODS_BY_FIELD_TYPE.items()
+        for operator_type, operator_methods in METHODS_BY_OPERATOR_TYPE.items()
+    }
+    return cls
+
+
 class DataOperator:
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_methods(cls)
+
     def __init__(self, field_type: str, operator_type: str, **kwargs):
         """
 
         Acceptable kwargs:
         - lod: list of dictionaries; each dictionary represents a "record"; e.g. [{"id": "a", "name": "joe"}, {"id": "b", "name": "jane"}]
+          or a `ColumnarRecords`, in which case select_master_record methods return row indexes instead of records
         - field: the field to apply the operator to; e.g. "name", "age", "numberofemployees"
         - operator: the operator to apply; e.g. "contains", "greater_than", "max"
         - datetime_field: the field to use for datetime comparison; e.g. "created_at"
         - value: the value to compare against; e.g. "joe"
+        - validation: how thoroughly `lod` is checked; one of "strict" (default), "sampled" or "trusted"
+        - timestamp_cache: a `TimestampCache` shared across operators so each timestamp is parsed once
+        - tenant: whose email domain overlay applies to keep_corporate_domain; see `email_domains.set_tenant_overlay`
 
         NOTE: Joins and aggregations should take place _before_ this step. In other words, tables should be joined and aggregations 
         should be fed into `lod` with the aggregation as its own column. Then evaluation can take place as if these were any
@@ -208,8 +361,8 @@ class DataOperator:
         elif field_type not in METHODS_BY_FIELD_TYPE:
             field_type = FIELD_TYPE_MAP.get(field_type, field_type)
 
-        assert operator_type in list(METHODS_BY_OPERATOR_TYPE.keys()), f"Invalid operator_type: {operator_type}; must be one of {list(METHODS_BY_OPERATOR_TYPE.keys())}"
-        assert field_type in list(METHODS_BY_FIELD_TYPE.keys()), f"Invalid field_type: {field_type}; must be one of {list(METHODS_BY_FIELD_TYPE.keys())}"
+        assert operator_type in METHODS_BY_OPERATOR_TYPE, f"Invalid operator_type: {operator_type}; must be one of {list(METHODS_BY_OPERATOR_TYPE.keys())}"
+        assert field_type in METHODS_BY_FIELD_TYPE, f"Invalid field_type: {field_type}; must be one of {list(METHODS_BY_FIELD_TYPE.keys())}"
 
         self.field_type = field_type
         self.operator_type = operator_type
@@ -219,64 +372,175 @@ class DataOperator:
         self.operator = kwargs.get('operator').lower() if kwargs.get('operator') else None # e.g. "greater_than", "max", "keep_recent_value", "keep_oldest_value", "preserve_priority"
         self.datetime_field = kwargs.get('datetime_field').lower() if kwargs.get('datetime_field') else None
         self.value = kwargs.get('value', None)
+        self.validation = kwargs.get('validation').lower() if kwargs.get('validation') else 'strict'
+        self.timestamp_cache = kwargs.get('timestamp_cache')
+        self.tenant = kwargs.get('tenant')
+
+        assert self.validation in VALIDATION_LEVELS, f"Invalid validation: {self.validation}; must be one of {list(VALIDATION_LEVELS)}"
 
         if self.lod:
-            assert self.field, "'field' is a required kwarg when 'lod' is provided"
-            assert isinstance(self.lod, list)
-            assert all(isinstance(record, dict) for record in self.lod)
-        
-        if self.lod and self.operator_type != "update_field":
-            assert all(self.field in d for d in self.lod), f"Field '{self.field}' not found in all dictionaries"
-            
+            self._validate_lod()
+            self._validate_value()
+
+        if self.operator:
+            self._validate_operator()
+
+        # if self.operator in ('KEEP_RECENT_VALUE', 'KEEP_OLDEST_VALUE'):
+        #     assert self.datetime_field, "'datetime_field' is a required kwarg when using KEEP_RECENT_VALUE or KEEP_OLDEST_VALUE operator"
+
+    @classmethod
+    def compile(cls, field_type: str, operator_type: str, operator: str, field: str, **kwargs) -> "CompiledOperator":
+        """
+        Validate an operator configuration once and return a reusable callable which
+        applies it to any number of `lod`s; e.g.
+
+            keep_max = DataOperator.compile("number", "merge_values", "keep_max_value", "age")
+            keep_max([{"age": 30}, {"age": 35}])
+            >>> 35
+
+        Accepts the same kwargs as the constructor except `lod`. Configuration checks
+        (field_type, operator_type, operator, value) run here; the per-record scans over
+        `lod` are skipped when the compiled operator is called unless a `validation`
+        level other than "trusted" is given.
+        """
+        kwargs.setdefault('validation', 'trusted')
+        assert 'lod' not in kwargs, "'lod' is provided when calling a compiled operator, not when compiling it"
+        assert operator, "'operator' is required when compiling an operator"
+        assert field, "'field' is required when compiling an operator"
+        template = cls(field_type, operator_type, operator=operator, field=field, **kwargs)
+        template._validate_value()
+        return CompiledOperator(template)
+
+    def _validate_lod(self, validation: str = None):
+        validation = validation or self.validation
+        assert self.field, "'field' is a required kwarg when 'lod' is provided"
+        assert isinstance(self.lod, (list, ColumnarRecords))
+
+        if isinstance(self.lod, ColumnarRecords):
+            # every row has every column, so there is nothing to check per record
+            if self.operator_type != "update_field":
+                assert self.field in self.lod.columns, f"Field '{self.field}' not found in all dictionaries"
+            else:
+                assert self.lod.writable(self.field), f"update_field requires '{self.field}' to be a list or object array column"
+            records = ()
+        elif validation == 'trusted':
+            records = ()
+        elif validation == 'sampled' and len(self.lod) > VALIDATION_SAMPLE_SIZE:
+            records = random.sample(self.lod, VALIDATION_SAMPLE_SIZE)
+        else:
+            records = self.lod
+
+        assert all(isinstance(record, dict) for record in records)
+
+        if self.operator_type != "update_field":
+            assert all(self.field in d for d in records), f"Field '{self.field}' not found in all dictionaries"
+
         # Evaluate condition operations should only work with single records
-        if self.lod and self.operator_type == "evaluate_condition":
+        if self.operator_type == "evaluate_condition":
             assert len(self.lod) == 1, "evaluate_condition operations require exactly one record in lod"
 
-        if self.lod and self.operator in ('set_true', 'set_false'):
+    def _validate_value(self):
+        if self.operator in ('set_true', 'set_false'):
             assert self.field_type == "boolean", f"{self.operator} can only be used when field_type = boolean"
             assert self.value is None, "value cannot be provided when using set_true or set_false operators"
 
-        if self.lod and self.operator in ('update_if_blank', 'overwrite'):
+        if self.operator in ('update_if_blank', 'overwrite'):
             assert self.value, "value must be provided when using update_if_blank or overwrite operators"
 
-        if self.operator:
-            # assert self.field, "'field' is a required kwarg when 'operator' is provided"
-            assert self.operator in METHODS_BY_OPERATOR_TYPE[self.operator_type], f"Invalid operator: {self.operator}; must be one of {list(METHODS_BY_OPERATOR_TYPE[self.operator_type])}"
-            assert self.operator in METHODS_BY_FIELD_TYPE[self.field_type], f"Invalid operator: {self.operator}; must be one of {list(METHODS_BY_FIELD_TYPE[self.field_type])}"
+        if self.operator == 'keep_record_by_criteria':
+            assert isinstance(self.value, list) and self.value, "value must be a list of criteria when using keep_record_by_criteria"
+            for criterion in self.value:
+                assert criterion.get('rule') in CRITERIA_RULES, f"Invalid rule: {criterion.get('rule')}; must be one of {list(CRITERIA_RULES)}"
+                if criterion['rule'] == 'priority':
+                    assert type(criterion.get('value')) == list, "'priority' criteria require a list of values in order of priority"
 
-        # if self.operator in ('KEEP_RECENT_VALUE', 'KEEP_OLDEST_VALUE'):
-        #     assert self.datetime_field, "'datetime_field' is a required kwarg when using KEEP_RECENT_VALUE or KEEP_OLDEST_VALUE operator"
+        if self.operator == 'matches' and self.value is not None:
+            assert isinstance(self.value, (list, dict)), "value must be a list of blocking keys or a dict of RecordMatcher kwargs when using matches"
+
+    def _validate_operator(self):
+        # assert self.field, "'field' is a required kwarg when 'operator' is provided"
+        assert self.operator in METHODS_BY_OPERATOR_TYPE[self.operator_type], f"Invalid operator: {self.operator}; must be one of {list(METHODS_BY_OPERATOR_TYPE[self.operator_type])}"
+        assert self.operator in METHODS_BY_FIELD_TYPE[self.field_type], f"Invalid operator: {self.operator}; must be one of {list(METHODS_BY_FIELD_TYPE[self.field_type])}"
 
     def _get_created_datetime_field(self):
         if self.datetime_field:
             return self.datetime_field
-        elif "createddate" in self.lod[0]:
-            return "createddate"
-        elif "created_at" in self.lod[0]:
-            return "created_at"
-        elif "createdat" in self.lod[0]:
-            return "createdat"
-        else:
-            raise ValueError("No datetime field found")
+        return find_created_datetime_field(self.lod[0])
+
+    def _values(self, field: str) -> list:
+        """ Values of `field` for every record in lod """
+        if isinstance(self.lod, ColumnarRecords):
+            return self.lod.values(field)
+        return [d[field] for d in self.lod]
+
+    def _survivors(self, indexes: list) -> list:
+        """ The surviving records at `indexes` in lod; for columnar lods, the row indexes themselves """
+        if isinstance(self.lod, ColumnarRecords):
+            return list(indexes)
+        return [self.lod[i] for i in indexes]
+
+    def _timestamps(self, field: str) -> list:
+        """ Epoch microseconds of `field` for every record in lod; None where the field is blank """
+        if self.timestamp_cache is not None:
+            return self.timestamp_cache.column(self.lod, field)
+        return [None if v in ['', None] else to_epoch_microseconds(v) for v in self._values(field)]
+
+    def _extreme_timestamp_indexes(self, field: str, newest: bool) -> list:
+        """ Indexes of the record(s) in lod holding the newest (or oldest) timestamp in `field` """
+        if vectorized.HAS_NUMPY and self.timestamp_cache is None and len(self.lod) >= vectorized.VECTORIZE_MIN_RECORDS:
+            try:
+                if isinstance(self.lod, ColumnarRecords):
+                    return vectorized.extreme_datetime_indexes(self.lod.column(field), newest)
+                return vectorized.extreme_datetime_indexes([d[field] for d in self.lod], newest)
+            except ValueError:
+                pass # let the pure Python path report unparseable or missing values
+
+        timestamps = self._timestamps(field)
+        present = [t for t in timestamps if t is not None]
+        if not present:
+            raise ValueError(f"No values found for datetime field '{field}'")
+        target = max(present) if newest else min(present)
+        return [i for i, t in enumerate(timestamps) if t == target]
+
+    def _invalidate_timestamps(self):
+        if self.timestamp_cache is not None:
+            self.timestamp_cache.invalidate(self.field)
 
     def _convert_keys_to_lowercase(self, original_dict):
         return dict((k.lower(), v) for k,v in original_dict.items())
 
     def get_methods(self):
-        return [
-            method_name for method_name, method in inspect.getmembers(self, predicate=inspect.isroutine) 
-            if not method_name.startswith("__")
-            and method_name not in ('execute', 'get_methods')
-            and method_name in METHODS_BY_OPERATOR_TYPE[self.operator_type]
-            and method_name in METHODS_BY_FIELD_TYPE[self.field_type]
-            ]
+        return list(self._method_registry[(self.field_type, self.operator_type)])
 
     def execute(self):
-        _method = getattr(self, self.operator.lower())
+        _method = self._dispatch_table.get(self.operator)
+        assert _method, f"Invalid operator: {self.operator}; must be one of {self.get_methods()}"
+        return self._run(_method)
+
+    def execute_many(self, clusters) -> list:
+        """
+        Apply this operator's configuration to each `lod` in `clusters` and return
+        the results in order; e.g. one result per duplicate cluster. `lod` passed to
+        the constructor (if any) is ignored. See `CompiledOperator.execute_many`.
+        """
+        return list(self.iter_execute(clusters))
+
+    def iter_execute(self, clusters):
+        """ Generator variant of `execute_many`. """
+        assert self.operator, "'operator' is required to execute an operator"
+        assert self.field, "'field' is required to execute an operator"
+        self._validate_value()
+        return CompiledOperator(self).iter_execute(clusters)
+
+    def _run(self, method):
         try:
-            return _method()
-        except Exception as e:
-            raise e
+            return method(self)
+        except (KeyError, TypeError, AttributeError):
+            # records were only partially checked up front; check them all now so that
+            # a bad record is reported the same way strict validation would report it
+            if self.lod and self.validation != 'strict':
+                self._validate_lod('strict')
+            raise
 
     # shared or base components
     def common_assert_number(self):
@@ -304,27 +568,58 @@ class DataOperator:
         return max(d[self.field] for d in self.lod)
 
     # Evaluate conditions
+    def _comparable(self, substring: bool = False) -> tuple:
+        """
+        The first record's value and `value`, as canonical keys for field types with a
+        normalizer in FIELD_NORMALIZERS (e.g. phone); as-is if either has no key. For
+        substring tests, url fields are compared as-is, since their key (the registrable
+        domain) drops the subdomain and path which "contains" is usually asked about.
+        """
+        from dataoperator.normalize import FIELD_NORMALIZERS
+        record_value = self.lod[0][self.field]
+        if substring and self.field_type == 'url':
+            return record_value, self.value
+        normalize = FIELD_NORMALIZERS.get(self.field_type)
+        if normalize is not None:
+            record_key, key = normalize(record_value), normalize(self.value)
+            if record_key is not None and key is not None:
+                return record_key, key
+        return record_value, self.value
+
     def equals(self) -> bool:
         self.common_assert_lod()
-        return self.lod[0][self.field] == self.value
+        record_value, value = self._comparable()
+        return record_value == value
 
     def not_equals(self) -> bool:
         self.common_assert_lod()
-        return self.lod[0][self.field] != self.value
+        record_value, value = self._comparable()
+        return record_value != value
 
     def contains(self) -> bool:
         self.common_assert_lod()
-        return self.value.lower() in self.lod[0][self.field].lower()
+        record_value, value = self._comparable(substring=True)
+        return value.lower() in record_value.lower()
 
     def not_contains(self) -> bool:
         self.common_assert_lod()
-        return self.value.lower() not in self.lod[0][self.field].lower()
+        record_value, value = self._comparable(substring=True)
+        return value.lower() not in record_value.lower()
 
-    def matches(self):
-        """ 
-        This method is merely a placeholder, and must be implemented 
-        upstream """
-        raise NotImplementedError
+    def matches(self) -> "MatchResult":
+        """
+        Pairs of matching records in lod; see `matching.RecordMatcher`. `value` configures
+        the matcher: a list of blocking keys (e.g. [("email_domain", "email"), ("soundex", "lastname")])
+        or a dict of RecordMatcher kwargs (e.g. {"strategy": "sorted_neighborhood", "window": 5, "blocking": [...]}).
+        By default records match on equal `field` values, compared as canonical keys for
+        field types with a normalizer in FIELD_NORMALIZERS (e.g. phone).
+        """
+        # matching (and the minhash / similarity modules behind it) is only imported when
+        # records are matched, keeping it out of the import of this module
+        from dataoperator.matching import RecordMatcher
+        from dataoperator.normalize import FIELD_NORMALIZERS
+        self.common_assert_lod()
+        return RecordMatcher.from_value(self.field, self.value, FIELD_NORMALIZERS.get(self.field_type)).match(self.lod)
 
     # Set values
     def set_string(self):
@@ -332,6 +627,7 @@ class DataOperator:
         for item in self.lod:
             if self.field in item:
                 item[self.field] = self.value
+        self._invalidate_timestamps()
         return self.lod
 
     def append_string(self):
@@ -340,6 +636,7 @@ class DataOperator:
             if self.field in item:
                 existing_value = item[self.field] or ""
                 item[self.field] = str(existing_value) + str(self.value)
+        self._invalidate_timestamps()
         return self.lod
 
     def prepend_string(self):
@@ -348,6 +645,7 @@ class DataOperator:
             if self.field in item:
                 existing_value = item[self.field] or ""
                 item[self.field] = str(self.value) + str(existing_value)
+        self._invalidate_timestamps()
         return self.lod
 
     def set_true(self):
@@ -355,6 +653,7 @@ class DataOperator:
         for item in self.lod:
             if self.field in item:
                 item[self.field] = True
+        self._invalidate_timestamps()
         return self.lod
 
     def set_false(self):
@@ -362,6 +661,7 @@ class DataOperator:
         for item in self.lod:
             if self.field in item:
                 item[self.field] = False
+        self._invalidate_timestamps()
         return self.lod
 
     # Deduplication -> surviving record methods
@@ -371,87 +671,61 @@ class DataOperator:
         """
         self.common_assert_lod()
         max_value = self._max_value()
-        records = [d for d in self.lod if d[self.field] == max_value]
-        return records
+        return self._survivors([i for i, d in enumerate(self.lod) if d[self.field] == max_value])
 
     def keep_record_with_min_value(self) -> list:
         self.common_assert_lod()
         min_value = self._min_value()
-        records = [d for d in self.lod if d[self.field] == min_value]
-        return records
+        return self._survivors([i for i, d in enumerate(self.lod) if d[self.field] == min_value])
 
     def keep_record_with_newest_value(self) -> list:
         self.common_assert_lod()
-        
-        # Convert datetime strings to datetime objects for comparison
-        max_datetime = max(
-            datetime.fromisoformat( d[self.field] ) 
-            for d in self.lod
-            if d[self.field] not in ['', None]
-        )
-        
-        # Find the record(s) that match max_datetime
-        records = [
-            d for d in self.lod 
-            if d[self.field] not in ['', None]
-            and datetime.fromisoformat(d[self.field]) == max_datetime
-        ]
-        
-        return records
+        return self._survivors(self._extreme_timestamp_indexes(self.field, newest=True))
 
     def keep_record_with_oldest_value(self) -> list:
-        """ TODO FIXME - refactor so that oldest and newest can share code """
+        self.common_assert_lod()
+        return self._survivors(self._extreme_timestamp_indexes(self.field, newest=False))
+
+    def keep_record_by_criteria(self) -> list:
+        """
+        Resolve a single master record using an ordered list of criteria, given in
+        self.value; each criterion only breaks ties left by the ones before it, e.g.
 
+        [
+            {"rule": "max"},                                  # max of self.field
+            {"field": "lastmodifieddate", "rule": "newest"},
+            {"field": "leadsource", "rule": "priority", "value": ["Partner", "Web"]},
+        ]
+
+        Rules are "max", "min", "newest", "oldest" and "priority"; "field" defaults to
+        self.field. Blank values lose to any value. Records still tied after the last
+        criterion are resolved in favour of the first one in lod.
+        """
         self.common_assert_lod()
-        
-        # Convert datetime strings to datetime objects for comparison
-        min_datetime = min(
-            datetime.fromisoformat(d[self.field]) 
-            for d in self.lod
-            if d[self.field] not in ['', None]
-        )
-        
-        # Find the record(s) that match min_datetime
-        records = [
-            d for d in self.lod 
-            if d[self.field] not in ['', None]
-            and datetime.fromisoformat(d[self.field]) == min_datetime
+        criteria = [
+            (criterion.get('field', self.field).lower(), criterion['rule'], criterion.get('value'))
+            for criterion in self.value
         ]
-        
-        return records
+
+        parse = self.timestamp_cache.parse if self.timestamp_cache is not None else to_epoch_microseconds
+
+        master, master_key = None, None
+        for i, record in enumerate(self.lod):
+            key = tuple(_criterion_key(record[field], rule, priority, parse) for field, rule, priority in criteria)
+            if master_key is None or key > master_key:
+                master, master_key = i, key
+        return self._survivors([master])
 
     # Deduplication -> field merge methods
     def keep_oldest_value(self) -> str:
         self.common_assert_lod()
         datetime_field = self._get_created_datetime_field()
-        min_datetime = min(
-            datetime.fromisoformat(d[datetime_field]) 
-            for d in self.lod
-            if d[datetime_field] is not None
-        )
-        # get the record in lod that has the min_datetime
-        record = [
-            d for d in self.lod 
-            if d[datetime_field] not in ['', None]
-            and datetime.fromisoformat(d[datetime_field]) == min_datetime
-        ][0]
-        return record[self.field]
+        return self.lod[self._extreme_timestamp_indexes(datetime_field, newest=False)[0]][self.field]
 
     def keep_newest_value(self) -> str:
         self.common_assert_lod()
         datetime_field = self._get_created_datetime_field()
-        max_datetime = max(
-            datetime.fromisoformat(d[datetime_field]) 
-            for d in self.lod
-            if d[datetime_field] not in ['', None]
-        )
-        # get the record in lod that has the max_datetime
-        record = [
-            d for d in self.lod
-            if d[datetime_field] not in ['', None]
-            and datetime.fromisoformat(d[datetime_field]) == max_datetime
-        ][0]
-        return record[self.field]
+        return self.lod[self._extreme_timestamp_indexes(datetime_field, newest=True)[0]][self.field]
 
     def keep_max_value(self) -> int:
         if self.at_least_one_value_in_lod_for_field():
@@ -496,19 +770,14 @@ class DataOperator:
                     return value
         return None
 
-    def keep_corporate_domain(self) -> str:  
-        """ 
-        TODO FIXME - this will always return the first record's domain if there are multiple 
-        corporate domains; there should be some additional logic to handle cases where there
-        are multiple corporate domains (e.g. email validation, comparison with other fields in
-        the record, etc.)
+    def keep_corporate_domain(self) -> str:
+        """
+        The corporate email best corroborated by the records' website / domain and company
+        name fields (CORROBORATING_FIELDS), else the first corporate email; None if there
+        are no corporate emails. See `select_corporate_email`.
         """
         self.common_assert_lod()
-        return [
-            d[self.field] for d in self.lod 
-            if d[self.field].split("@")[1] not in FREE_EMAIL_DOMAINS 
-            and d[self.field].split("@")[1] not in DISPOSABLE_EMAIL_DOMAINS
-            ][0]
+        return select_corporate_email(self.lod, self.field, self.tenant)
 
     def update_if_blank(self):
         """
@@ -519,6 +788,7 @@ class DataOperator:
             if self.field in item:
                 if item[self.field] in ['', None]:
                     item[self.field] = self.value
+        self._invalidate_timestamps()
         return self.lod
 
     def overwrite(self):
@@ -529,4 +799,78 @@ class DataOperator:
         for item in self.lod:
             if self.field in item:
                 item[self.field] = self.value
-        return self.lod
\ No newline at end of file
+        self._invalidate_timestamps()
+        return self.lod
+
+
+_register_methods(DataOperator)
+
+
+def __getattr__(name):
+    # the email domain lists are imported on first use; see dataoperator.email_domains
+    if name == 'FREE_EMAIL_DOMAINS':
+        from dataoperator.free_email_domains import FREE_EMAIL_DOMAINS
+        return FREE_EMAIL_DOMAINS
+    if name == 'DISPOSABLE_EMAIL_DOMAINS':
+        from dataoperator.disposable_email_domains import DISPOSABLE_EMAIL_DOMAINS
+        return DISPOSABLE_EMAIL_DOMAINS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class CompiledOperator:
+    """
+    A validated DataOperator configuration which can be applied to many `lod`s.
+    Created with `DataOperator.compile(...)`; calling it with a `lod` returns the
+    same result as `DataOperator(..., lod=lod).execute()` without re-running the
+    constructor's configuration checks.
+    """
+
+    __slots__ = ('_cls', '_state', '_method')
+
+    def __init__(self, template: DataOperator):
+        self._cls = type(template)
+        self._state = dict(template.__dict__)
+        self._method = self._cls._dispatch_table[template.operator]
+
+    def __repr__(self):
+        return (
+            f"<CompiledOperator {self._state['field_type']}.{self._state['operator_type']}"
+            f".{self._state['operator']}({self._state['field']!r})>"
+        )
+
+    def _bind(self, lod: list, state: dict = None) -> DataOperator:
+        operator = object.__new__(self._cls)
+        operator.__dict__.update(state or self._state)
+        operator.lod = lod
+        return operator
+
+    def __call__(self, lod: list):
+        operator = self._bind(lod)
+        if lod:
+            operator._validate_lod()
+        return operator._run(self._method)
+
+    def execute_many(self, clusters) -> list:
+        """
+        Apply the operator to each `lod` in `clusters` (any iterable of `lod`s) and
+        return the results in the same order.
+
+        Clusters are expected to share a schema, as rows of the same table do: the
+        datetime field used by keep_newest_value / keep_oldest_value is detected once,
+        from the first non-empty cluster, and reused for the rest.
+        """
+        return list(self.iter_execute(clusters))
+
+    def iter_execute(self, clusters):
+        """ Generator variant of `execute_many`; yields one result per cluster. """
+        state = dict(self._state)
+        method = self._method
+        detect_datetime_field = state['datetime_field'] is None and state['operator'] in _DATETIME_FIELD_METHODS
+        for lod in clusters:
+            operator = self._bind(lod, state)
+            if lod:
+                operator._validate_lod()
+                if detect_datetime_field:
+                    state['datetime_field'] = operator._get_created_datetime_field()
+                    detect_datetime_field = False
+            yield operator._run(method)
@@ -0,0 +1,101 @@
+from dataoperator.dataoperator import CompiledOperator, DataOperator
+from dataoperator.merge import RecordMerger
+from dataoperator.normalize import FIELD_NORMALIZERS
+
+
+class DedupeEngine:
+    """
+    Deduplicates a flat stream of records: records are hash-grouped on a cluster key,
+    then each cluster of duplicates is reduced to one golden record by selecting a
+    master record (`survivorship`) and merging fields into it (`merge_spec`); e.g.
+
+        engine = DedupeEngine(
+            key="email",
+            survivorship={"field_type": "number", "operator": "keep_record_with_max_value", "field": "numberofemployees"},
+            merge_spec={"phone": "keep_newest_value", "description": "concatenate_all_values"},
+        )
+        golden_records = engine.execute(records)
+
+    - key: the field to group on, or a callable returning the key for a record.
+      Records with a blank key ('' or None) are never grouped with other records.
+    - normalize: a callable applied to each key before grouping, or a field type with a
+      canonical key in FIELD_NORMALIZERS ("email", "phone" or "url"); e.g. with
+      normalize="email", "Jo.Smith+news@gmail.com" and "josmith@googlemail.com" are
+      one cluster. Keys are memoized, so each distinct value is normalized once.
+    - survivorship: `DataOperator.compile` kwargs for a select_master_record operator
+      (operator_type may be omitted), or an already compiled operator. The first
+      surviving record is the master; without survivorship it's the first record seen.
+    - merge_spec: a `RecordMerger` spec applied to each cluster, copying merged
+      fields onto the master record.
+    - datetime_field, timestamp_cache, tenant: passed to the `RecordMerger`.
+
+    Clusters with a single record are passed through as a copy of that record.
+    """
+
+    def __init__(self, key, survivorship=None, merge_spec: dict = None, datetime_field: str = None, timestamp_cache=None, tenant=None, normalize=None):
+        assert key, "key is required"
+        if isinstance(key, str):
+            field = key.lower()
+            key = lambda record: record[field]
+        assert callable(key), "key must be a field name or a callable"
+        if isinstance(normalize, str):
+            assert normalize in FIELD_NORMALIZERS, f"Invalid normalize: {normalize}; must be a callable or one of {list(FIELD_NORMALIZERS)}"
+            normalize = FIELD_NORMALIZERS[normalize]
+        if normalize is not None:
+            assert callable(normalize), "normalize must be a field type or a callable"
+            record_key = key
+            key = lambda record: normalize(record_key(record))
+        self.key = key
+
+        if isinstance(survivorship, dict):
+            survivorship = dict(survivorship)
+            operator_type = survivorship.pop('operator_type', 'select_master_record')
+            assert operator_type == 'select_master_record', "survivorship must be a select_master_record operator"
+            survivorship = DataOperator.compile(operator_type=operator_type, **survivorship)
+        assert survivorship is None or isinstance(survivorship, CompiledOperator), "survivorship must be a dict of operator kwargs or a compiled operator"
+        self.survivorship = survivorship
+
+        self.merger = RecordMerger(merge_spec, datetime_field=datetime_field, timestamp_cache=timestamp_cache, tenant=tenant) if merge_spec else None
+
+    def group(self, records) -> list:
+        """ Hash-group `records` on the key; returns the clusters in order of first appearance. """
+        key = self.key
+        clusters = {}
+        ungrouped = 0
+        for record in records:
+            value = key(record)
+            if value in ['', None]:
+                # a unique key per record, so blank keys never group together
+                value = (DedupeEngine, ungrouped)
+                ungrouped += 1
+            cluster = clusters.get(value)
+            if cluster is None:
+                clusters[value] = [record]
+            else:
+                cluster.append(record)
+        return list(clusters.values())
+
+    def select_master(self, cluster: list):
+        if self.survivorship is None:
+            return cluster[0]
+        survivors = self.survivorship(cluster)
+        assert isinstance(survivors, list), "survivorship operator must return a list of surviving records"
+        return survivors[0] if survivors else cluster[0]
+
+    def merge_cluster(self, cluster: list) -> dict:
+        """ The golden record for one cluster of duplicates. """
+        if len(cluster) == 1:
+            return dict(cluster[0])
+        master = self.select_master(cluster)
+        if self.merger is None:
+            return dict(master)
+        return self.merger.merge(cluster, master)
+
+    def execute(self, records) -> list:
+        """ Golden records for `records` (any iterable of records, or a ColumnarRecords). """
+        return list(self.iter_execute(records))
+
+    def iter_execute(self, records):
+        """ Generator variant of `execute`; grouping consumes all records before the first result. """
+        for cluster in self.group(records):
+            yield self.merge_cluster(cluster)
@@ -0,0 +1,127 @@
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping
+
+from dataoperator.email_domains import DISPOSABLE, FREE
+
+# File layout (little-endian): a header (magic, domain count, size of the domain blob),
+# count + 1 uint32 offsets into the blob, one category byte per domain, then the blob
+# of UTF-8 domains sorted by their bytes.
+MAGIC = b'DODOMDB1'
+
+_HEADER = struct.Struct('<8sII')
+_OFFSET = struct.Struct('<I')
+
+CATEGORY_CODES = {FREE: 1, DISPOSABLE: 2}
+_CATEGORIES_BY_CODE = {code: category for category, code in CATEGORY_CODES.items()}
+
+
+def write_domain_db(path: str, index: dict = None) -> int:
+    """
+    Write `index` (domain -> FREE or DISPOSABLE; default: the built-in domain lists)
+    to `path`, replacing it atomically. Returns the number of domains written.
+    """
+    if index is None:
+        from dataoperator.email_domains import _build_domain_index
+        index = _build_domain_index()
+
+    entries = sorted((domain.encode('utf-8'), CATEGORY_CODES[category]) for domain, category in index.items())
+    offsets = [0]
+    for domain, _ in entries:
+        offsets.append(offsets[-1] + len(domain))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(entries), offsets[-1]))
+        f.write(struct.pack(f'<{len(offsets)}I', *offsets))
+        f.write(bytes(code for _, code in entries))
+        f.write(b''.join(domain for domain, _ in entries))
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+class DomainDB(Mapping):
+    """
+    Read-only mapping of domain -> FREE or DISPOSABLE backed by a file written by
+    `write_domain_db`. Lookups binary-search the file through a read-only `mmap`
+    instead of building Python sets, so every worker process that opens the same
+    file shares one copy of it in the OS page cache. Generate the file with
+
+        python -m dataoperator.domain_db /path/to/email_domains.db
+
+    and use it for email domain lookups with `email_domains.preload(db_path=...)`
+    or by setting the DATAOPERATOR_DOMAIN_DB environment variable.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._count, blob_size = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an email domain database")
+
+        self._offsets_start = _HEADER.size
+        self._categories_start = self._offsets_start + _OFFSET.size * (self._count + 1)
+        self._blob_start = self._categories_start + self._count
+        if len(self._mmap) != self._blob_start + blob_size:
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._mmap.close()
+
+    def _domain(self, i: int) -> bytes:
+        start, end = struct.unpack_from('<II', self._mmap, self._offsets_start + _OFFSET.size * i)
+        return self._mmap[self._blob_start + start:self._blob_start + end]
+
+    def _find(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._domain(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._domain(lo) == key:
+            return lo
+        return -1
+
+    def __getitem__(self, domain: str) -> str:
+        i = self._find(domain.encode('utf-8'))
+        if i == -1:
+            raise KeyError(domain)
+        return _CATEGORIES_BY_CODE[self._mmap[self._categories_start + i]]
+
+    def get(self, domain: str, default=None):
+        i = self._find(domain.encode('utf-8'))
+        if i == -1:
+            return default
+        return _CATEGORIES_BY_CODE[self._mmap[self._categories_start + i]]
+
+    def __contains__(self, domain) -> bool:
+        return isinstance(domain, str) and self._find(domain.encode('utf-8')) != -1
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._domain(i).decode('utf-8')
+
+    def __len__(self):
+        return self._count
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m dataoperator.domain_db PATH")
+    count = write_domain_db(sys.argv[1])
+    print(f"wrote {count} domains to {sys.argv[1]}")
@@ -0,0 +1,121 @@
+import os
+import re
+import sys
+
+# Build step for the email domain lists: the plain-text lists in data/ (one domain per
+# line, '#' comments) are validated, normalized and deduplicated, then rendered as the
+# frozenset modules the email domain index is built from. Run it after editing a list:
+#
+#     make domains
+#
+# which is `python -m dataoperator.domain_lists`; add `--check` to only verify that the
+# generated modules are up to date, or `--db PATH` to also write a binary domain database.
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(PACKAGE_DIR)), 'data')
+
+# source list -> (generated module, constant name)
+DOMAIN_LISTS = {
+    'free_email_domains.txt': ('free_email_domains.py', 'FREE_EMAIL_DOMAINS'),
+    'disposable_email_domains.txt': ('disposable_email_domains.py', 'DISPOSABLE_EMAIL_DOMAINS'),
+}
+
+_LABEL = r'[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?'
+DOMAIN_PATTERN = re.compile(rf'^(?=.{{1,253}}$){_LABEL}(?:\.{_LABEL})+$')
+
+
+def normalize_domain(entry: str) -> str:
+    """ Lowercase, strip a trailing dot and convert internationalized domains to punycode. """
+    domain = entry.strip().lower().rstrip('.')
+    if not domain.isascii():
+        try:
+            domain = domain.encode('idna').decode('ascii')
+        except UnicodeError:
+            pass # reported as malformed by the caller
+    return domain
+
+
+def parse_domain_list(lines, source: str = '<list>') -> list:
+    """
+    Sorted, deduplicated domains from the lines of a plain-text list. Blank lines and
+    '#' comments are ignored; raises ValueError listing every malformed entry.
+    """
+    domains = set()
+    errors = []
+    for line_number, line in enumerate(lines, start=1):
+        entry = line.split('#', 1)[0].strip()
+        if not entry:
+            continue
+        domain = normalize_domain(entry)
+        if not DOMAIN_PATTERN.match(domain):
+            errors.append(f"{source}:{line_number}: malformed domain {entry!r}")
+            continue
+        domains.add(domain)
+
+    if errors:
+        raise ValueError("\n".join(errors))
+    return sorted(domains)
+
+
+def render_domain_module(name: str, domains: list, source: str) -> str:
+    lines = [
+        f"# Generated from data/{source} by `make domains`; edit the list, not this file.",
+        f"{name} = frozenset({{",
+    ]
+    lines.extend(f'    "{domain}",' for domain in domains)
+    lines.append("})")
+    return "\n".join(lines) + "\n"
+
+
+def compile_domain_lists(source_dir: str = SOURCE_DIR, output_dir: str = PACKAGE_DIR, check: bool = False) -> dict:
+    """
+    Validate every list in DOMAIN_LISTS and write its module to `output_dir`. With
+    `check`, nothing is written and ValueError is raised if a module is out of date.
+    Returns {constant name: domains}.
+    """
+    compiled = {}
+    stale = []
+    for source, (module, name) in DOMAIN_LISTS.items():
+        with open(os.path.join(source_dir, source), encoding='utf-8') as f:
+            domains = parse_domain_list(f, source)
+        compiled[name] = domains
+
+        path = os.path.join(output_dir, module)
+        rendered = render_domain_module(name, domains, source)
+        if check:
+            if not os.path.exists(path):
+                stale.append(module)
+                continue
+            with open(path, encoding='utf-8') as f:
+                if f.read() != rendered:
+                    stale.append(module)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(rendered)
+
+    if stale:
+        raise ValueError(f"out of date, run `make domains`: {', '.join(stale)}")
+    return compiled
+
+
+def main(argv: list) -> int:
+    check = '--check' in argv
+    db_path = argv[argv.index('--db') + 1] if '--db' in argv else None
+    try:
+        compiled = compile_domain_lists(check=check)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    for name, domains in compiled.items():
+        print(f"{name}: {len(domains)} domains")
+    if db_path:
+        from dataoperator.domain_db import write_domain_db
+        from dataoperator.email_domains import build_domain_index
+        index = build_domain_index(compiled['FREE_EMAIL_DOMAINS'], compiled['DISPOSABLE_EMAIL_DOMAINS'])
+        print(f"wrote {write_domain_db(db_path, index)} domains to {db_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
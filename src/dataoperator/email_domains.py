@@ -0,0 +1,219 @@
+import os
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+
+from dataoperator.public_suffixes import PUBLIC_SUFFIXES
+
+# email domain categories
+FREE = 'free'
+DISPOSABLE = 'disposable'
+CORPORATE = 'corporate'
+INVALID = 'invalid'  # returned by classify_emails for values which aren't email addresses
+
+# distinct domains remembered by the bulk classification APIs
+CLASSIFY_CACHE_SIZE = 65536
+
+# The domain lists are several thousand lines of literals and most operators never
+# need them, so they're imported and indexed on the first email domain lookup (or
+# by `preload()`) rather than when this module is imported.
+_DOMAIN_INDEX = None
+_DOMAIN_INDEX_LOCK = threading.Lock()
+
+# tenant -> overlay (domain -> category) layered over the built-in index. The dict is
+# copied and replaced on every change, never mutated, so lookups read it without a lock.
+_TENANT_OVERLAYS = {}
+_TENANT_OVERLAYS_LOCK = threading.Lock()
+
+# path of a binary domain database (see dataoperator.domain_db) to use instead of the lists
+DOMAIN_DB_ENV_VAR = 'DATAOPERATOR_DOMAIN_DB'
+
+
+def build_domain_index(free_domains, disposable_domains) -> dict:
+    """ domain -> FREE or DISPOSABLE; disposable wins for domains on both lists """
+    index = dict.fromkeys(free_domains, FREE)
+    index.update(dict.fromkeys(disposable_domains, DISPOSABLE))
+    return index
+
+
+def _build_domain_index() -> dict:
+    from dataoperator.free_email_domains import FREE_EMAIL_DOMAINS
+    from dataoperator.disposable_email_domains import DISPOSABLE_EMAIL_DOMAINS
+    return build_domain_index(FREE_EMAIL_DOMAINS, DISPOSABLE_EMAIL_DOMAINS)
+
+
+def _load_domain_index(db_path: str = None):
+    global _DOMAIN_INDEX
+    with _DOMAIN_INDEX_LOCK:
+        # another thread may have loaded the index while this one waited for the lock
+        if _DOMAIN_INDEX is not None and not db_path:
+            return _DOMAIN_INDEX
+        db_path = db_path or os.environ.get(DOMAIN_DB_ENV_VAR)
+        if db_path:
+            from dataoperator.domain_db import DomainDB
+            # a replaced database isn't closed: lookups in flight and DOMAIN_INDEX proxies
+            # may still read it, and its mmap is released with the last reference
+            _DOMAIN_INDEX = DomainDB(db_path)
+        else:
+            _DOMAIN_INDEX = _build_domain_index()
+        _classify_domain.cache_clear()
+    return _DOMAIN_INDEX
+
+
+def preload(db_path: str = None):
+    """
+    Load the email domain lists now instead of on the first lookup; e.g. in a server
+    process before it starts taking requests (or forks workers). With `db_path` (or
+    the DATAOPERATOR_DOMAIN_DB environment variable, on the first load), lookups use
+    that memory-mapped binary domain database instead of the lists; see
+    `dataoperator.domain_db`. Without one, an index already loaded is kept.
+    """
+    _load_domain_index(db_path)
+
+
+def __getattr__(name):
+    # DOMAIN_INDEX: domain -> FREE or DISPOSABLE; any domain not in the index is CORPORATE
+    if name == 'DOMAIN_INDEX':
+        return MappingProxyType(_DOMAIN_INDEX or _load_domain_index())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def email_domain(email: str) -> str:
+    """ The lowercased domain of an email address; None if it has no '@'. """
+    _, at, domain = email.rpartition('@')
+    return domain.strip().lower() if at else None
+
+
+def _find_category(index, domain: str, match_subdomains: bool = True) -> str:
+    """
+    Category of a lowercased domain in `index`, or None. With `match_subdomains`, parent
+    domains are looked up in turn (e.g. "mail.yahoo.co.uk" -> "yahoo.co.uk"), so a
+    lookup takes at most one hash probe per label. The walk stops at public suffixes
+    (see PUBLIC_SUFFIXES), so e.g. "acme.za.com" doesn't inherit the category of the
+    free "za.com" mailbox provider.
+    """
+    category = index.get(domain)
+    if category is not None or not match_subdomains:
+        return category
+
+    dot = domain.find('.')
+    while dot != -1:
+        parent = domain[dot + 1:]
+        if '.' not in parent or parent in PUBLIC_SUFFIXES:
+            break
+        category = index.get(parent)
+        if category is not None:
+            return category
+        dot = domain.find('.', dot + 1)
+    return None
+
+
+def _lookup(domain: str, match_subdomains: bool = True) -> str:
+    """ Category of a lowercased domain in the built-in index. """
+    return _find_category(_DOMAIN_INDEX or _load_domain_index(), domain, match_subdomains) or CORPORATE
+
+
+def _tenant_lookup(tenant, domain: str, match_subdomains: bool = True) -> str:
+    """ Category of a lowercased domain in a tenant's overlay, or None. """
+    overlay = _TENANT_OVERLAYS.get(tenant)
+    return _find_category(overlay, domain, match_subdomains) if overlay else None
+
+
+def set_tenant_overlay(tenant, allow=(), block=(), block_category: str = DISPOSABLE):
+    """
+    Layer a tenant's own lists over the built-in index: for lookups made with
+    `tenant=tenant`, domains in `allow` (and their subdomains) are CORPORATE and domains
+    in `block` are `block_category`; `allow` wins for domains on both. Replaces the
+    tenant's previous overlay in one atomic swap, without rebuilding the built-in index
+    or blocking concurrent lookups.
+    """
+    assert block_category in [FREE, DISPOSABLE], f"Invalid block_category: {block_category}; must be one of {[FREE, DISPOSABLE]}"
+    overlay = dict.fromkeys((domain.strip().lower() for domain in block), block_category)
+    overlay.update(dict.fromkeys((domain.strip().lower() for domain in allow), CORPORATE))
+
+    global _TENANT_OVERLAYS
+    with _TENANT_OVERLAYS_LOCK:
+        overlays = dict(_TENANT_OVERLAYS)
+        overlays[tenant] = overlay
+        _TENANT_OVERLAYS = overlays
+
+
+def remove_tenant_overlay(tenant):
+    """ Drop a tenant's overlay; its lookups fall back to the built-in index. """
+    global _TENANT_OVERLAYS
+    with _TENANT_OVERLAYS_LOCK:
+        overlays = dict(_TENANT_OVERLAYS)
+        overlays.pop(tenant, None)
+        _TENANT_OVERLAYS = overlays
+
+
+def get_tenant_overlay(tenant) -> MappingProxyType:
+    """ Read-only view of a tenant's overlay (domain -> category); empty if it has none. """
+    return MappingProxyType(_TENANT_OVERLAYS.get(tenant, {}))
+
+
+def classify_email_domain(domain: str, match_subdomains: bool = True, tenant=None) -> str:
+    """
+    FREE, DISPOSABLE or CORPORATE for an email domain; e.g. "gmail.com" -> FREE.
+    Subdomains of a listed domain share its category unless `match_subdomains` is False.
+    With `tenant`, that tenant's overlay (see `set_tenant_overlay`) takes precedence.
+    """
+    domain = domain.strip().lower()
+    if tenant is not None:
+        category = _tenant_lookup(tenant, domain, match_subdomains)
+        if category is not None:
+            return category
+    return _lookup(domain, match_subdomains)
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def _classify_domain(domain: str) -> str:
+    return _lookup(domain)
+
+
+def classify_email(email: str, match_subdomains: bool = True, tenant=None) -> str:
+    """ FREE, DISPOSABLE or CORPORATE for the domain of an email address; None if it has no domain. """
+    domain = email_domain(email)
+    if not domain:
+        return None
+    if tenant is not None:
+        category = _tenant_lookup(tenant, domain, match_subdomains)
+        if category is not None:
+            return category
+    return _classify_domain(domain) if match_subdomains else _lookup(domain, False)
+
+
+def _valid_email_domain(email) -> str:
+    """ The lowercased domain of `email`, or None if it isn't a plausible email address. """
+    if not isinstance(email, str):
+        return None
+    local, at, domain = email.strip().rpartition('@')
+    if not at or not local or '.' not in domain or domain.startswith('.') or domain.endswith('.') or ' ' in domain:
+        return None
+    return domain.lower()
+
+
+def iter_classify_emails(emails, tenant=None):
+    """ Generator variant of `classify_emails`, for streams of addresses. """
+    classify_domain = _classify_domain
+    # the tenant's overlay when iteration starts applies to the whole stream
+    overlay = _TENANT_OVERLAYS.get(tenant) if tenant is not None else None
+    for email in emails:
+        domain = _valid_email_domain(email)
+        if not domain:
+            yield INVALID
+        elif overlay:
+            yield _find_category(overlay, domain) or classify_domain(domain)
+        else:
+            yield classify_domain(domain)
+
+
+def classify_emails(emails, tenant=None) -> list:
+    """
+    CORPORATE, FREE, DISPOSABLE or INVALID for each address in `emails` (any iterable,
+    e.g. a list, a NumPy array or a `ColumnarRecords` column). Each address is parsed
+    once and each distinct domain is classified once, memoized in a bounded LRU cache
+    (CLASSIFY_CACHE_SIZE domains) shared by every call. With `tenant`, that tenant's
+    overlay takes precedence.
+    """
+    return list(iter_classify_emails(emails, tenant))
@@ -1,4 +1,5 @@
-FREE_EMAIL_DOMAINS = {
+# Generated from data/free_email_domains.txt by `make domains`; edit the list, not this file.
+FREE_EMAIL_DOMAINS = frozenset({
     "0-mail.com",
     "027168.com",
     "0815.su",
@@ -77,8 +78,8 @@ FREE_EMAIL_DOMAINS = {
     "6ip.us",
     "6mail.cf",
     "6paq.com",
-    "74gmail.com",
     "74.ru",
+    "74gmail.com",
     "7mail.ga",
     "7mail.ml",
     "88.am",
@@ -523,8 +524,8 @@ FREE_EMAIL_DOMAINS = {
     "cia.hu",
     "ciaoweb.it",
     "cicciociccio.com",
-    "cincinow.net",
     "cinci.rr.com",
+    "cincinow.net",
     "citiz.net",
     "citlink.net",
     "citromail.hu",
@@ -1786,7 +1787,6 @@ FREE_EMAIL_DOMAINS = {
     "magicmail.co.za",
     "magspam.net",
     "mahmoodweb.com",
-    "mail.bg",
     "mail-awu.de",
     "mail-box.cz",
     "mail-center.com",
@@ -1799,6 +1799,7 @@ FREE_EMAIL_DOMAINS = {
     "mail.austria.com",
     "mail.az",
     "mail.be",
+    "mail.bg",
     "mail.bulgaria.com",
     "mail.by",
     "mail.co.za",
@@ -3299,8 +3300,8 @@ FREE_EMAIL_DOMAINS = {
     "mttestdriver.com",
     "muehlacker.tk",
     "muell.icu",
-    "muellmail.com",
     "muellemail.com",
+    "muellmail.com",
     "mundomail.net",
     "munich.com",
     "music.com",
@@ -4014,12 +4015,12 @@ FREE_EMAIL_DOMAINS = {
     "spacewar.com",
     "spainmail.com",
     "spam.2012-2016.ru",
+    "spam.care",
     "spamavert.com",
     "spambob.com",
     "spambob.org",
     "spambog.net",
     "spambooger.com",
-    "spam.care",
     "spamcero.com",
     "spamdecoy.net",
     "spameater.com",
@@ -4380,8 +4381,8 @@ FREE_EMAIL_DOMAINS = {
     "ukmax.com",
     "ukr.net",
     "uku.co.uk",
-    "ultra.fyi",
     "ultapulta.com",
+    "ultra.fyi",
     "ultrapostman.com",
     "ummah.org",
     "umpire.com",
@@ -4766,5 +4767,5 @@ FREE_EMAIL_DOMAINS = {
     "zzn.com",
     "zzom.co.uk",
     "zzz.com",
-    "zzz.pl"
-}
\ No newline at end of file
+    "zzz.pl",
+})
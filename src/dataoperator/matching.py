@@ -0,0 +1,360 @@
+from functools import lru_cache
+
+from dataoperator.columnar import ColumnarRecords
+from dataoperator.email_domains import email_domain
+from dataoperator.minhash import DEFAULT_NUM_PERM, DEFAULT_THRESHOLD, LSHIndex, MinHasher
+from dataoperator.normalize import EMAIL_DOMAIN_ALIASES, canonical_company_name, canonical_email, canonical_phone, registrable_domain
+from dataoperator.similarity import SIMILARITY_FUNCTIONS
+
+# Record matching for the `matches` operator. Comparing every pair of N records is
+# quadratic, so candidate pairs are generated first and each is then compared once:
+#
+# - blocking: records are grouped into blocks on one or more blocking keys (e.g. the
+#   email domain, or the soundex code of a name); records sharing a block are candidates
+# - sorted_neighborhood: for each key in turn, records are sorted on it and each record
+#   is a candidate with the next `window - 1` records, so keys which differ by a typo
+#   still meet; O(N * window) pairs per pass
+# - minhash: for each key in turn, records whose keys' MinHash signatures share an LSH
+#   band are candidates, so e.g. company names sharing most of their character shingles
+#   meet; see dataoperator.minhash
+MATCHING_STRATEGIES = ('blocking', 'sorted_neighborhood', 'minhash')
+DEFAULT_WINDOW = 10
+DEFAULT_MIN_SIMILARITY = 0.9
+
+
+def exact_key(value) -> str:
+    """ The value itself, stripped and lowercased; None if blank. """
+    if value in ['', None]:
+        return None
+    return str(value).strip().lower() or None
+
+
+def email_key(value) -> str:
+    """ The canonical key of an email address; see `normalize.canonical_email`. """
+    return canonical_email(value)
+
+
+def email_domain_key(value) -> str:
+    """ The lowercased domain of an email address, with provider aliases mapped to one domain; None if it has none. """
+    if not isinstance(value, str):
+        return None
+    domain = email_domain(value)
+    return EMAIL_DOMAIN_ALIASES.get(domain, domain) or None
+
+
+def phone_key(value) -> str:
+    """ The canonical (E.164-style) key of a phone number; see `normalize.canonical_phone`. """
+    return canonical_phone(value)
+
+
+def phone_last7_key(value) -> str:
+    """ The last 7 digits of a phone number's canonical key, so formatting and extensions are ignored; None if it has fewer. """
+    key = canonical_phone(value)
+    return key[-7:] if key is not None else None
+
+
+_SOUNDEX_CODES = {
+    letter: digit
+    for letters, digit in (('bfpv', '1'), ('cgjkqsxz', '2'), ('dt', '3'), ('l', '4'), ('mn', '5'), ('r', '6'))
+    for letter in letters
+}
+
+
+@lru_cache(maxsize=65536)
+def soundex(value: str) -> str:
+    """ American Soundex code of the letters in `value`; e.g. "Robert" -> "R163". None if it has no letters. """
+    letters = [c for c in value.lower() if 'a' <= c <= 'z']
+    if not letters:
+        return None
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0])
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter)
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if letter not in 'hw':
+            # vowels separate repeated codes; h and w don't
+            previous = digit
+    return code.ljust(4, '0')
+
+
+def url_domain_key(value) -> str:
+    """ The registrable domain of a URL; see `normalize.registrable_domain`. """
+    return registrable_domain(value)
+
+
+def soundex_key(value) -> str:
+    if not isinstance(value, str):
+        return None
+    return soundex(value)
+
+
+def company_name_key(value) -> str:
+    """ A company name without punctuation, case or legal suffixes; e.g. "ACME Corporation" -> "acme". """
+    return canonical_company_name(value)
+
+
+# blocking methods accepted in (method, field) blocking keys
+BLOCKING_METHODS = {
+    'exact': exact_key,
+    'email': email_key,
+    'email_domain': email_domain_key,
+    'phone': phone_key,
+    'phone_last7': phone_last7_key,
+    'soundex': soundex_key,
+    'company_name': company_name_key,
+    'url_domain': url_domain_key,
+}
+
+
+def _blocking_key_function(blocking_key):
+    """ record -> key for a (method, field) tuple, a callable, or a list of them (a composite key) """
+    if callable(blocking_key):
+        return blocking_key
+    if isinstance(blocking_key, list) and all(callable(key) or isinstance(key, (tuple, list)) for key in blocking_key):
+        key_functions = [_blocking_key_function(key) for key in blocking_key]
+
+        def composite_key(record):
+            keys = tuple(key_function(record) for key_function in key_functions)
+            return tuple(key or '' for key in keys) if any(keys) else None
+        return composite_key
+    assert isinstance(blocking_key, (tuple, list)) and len(blocking_key) == 2, f"Invalid blocking key: {blocking_key!r}; must be a (method, field) tuple or a callable"
+    method, field = blocking_key
+    assert method in BLOCKING_METHODS, f"Invalid blocking method: {method}; must be one of {list(BLOCKING_METHODS)}"
+    key_function = BLOCKING_METHODS[method]
+    field = field.lower()
+    return lambda record: key_function(record.get(field))
+
+
+class MatchResult:
+    """
+    The outcome of matching a list of records:
+
+    - pairs: (i, j) index pairs of matching records, i < j, in ascending order
+    - candidate_pairs: the number of pairs which were compared
+    - total_pairs: the number of pairs a full comparison would have compared
+    - reduction_ratio: the share of total_pairs blocking avoided comparing
+    - skipped_blocks: blocks left out for being larger than `max_block_size`
+    - scores: the similarity of each pair in `pairs`, when matching on `similarity`
+    """
+
+    __slots__ = ('pairs', 'candidate_pairs', 'total_pairs', 'skipped_blocks', 'scores')
+
+    def __init__(self, pairs: list, candidate_pairs: int, total_pairs: int, skipped_blocks: int = 0, scores: list = None):
+        self.pairs = pairs
+        self.candidate_pairs = candidate_pairs
+        self.total_pairs = total_pairs
+        self.skipped_blocks = skipped_blocks
+        self.scores = scores
+
+    @property
+    def reduction_ratio(self) -> float:
+        if not self.total_pairs:
+            return 0.0
+        return 1 - self.candidate_pairs / self.total_pairs
+
+    def __repr__(self):
+        return (
+            f"<MatchResult {len(self.pairs)} pairs from {self.candidate_pairs} candidates"
+            f" (reduction ratio {self.reduction_ratio:.4f})>"
+        )
+
+
+class RecordMatcher:
+    """
+    Finds pairs of matching records, comparing only records which share a block:
+
+        matcher = RecordMatcher(
+            field="email",
+            blocking=[("email_domain", "email"), ("phone_last7", "phone"), ("soundex", "lastname")],
+        )
+        result = matcher.match(records)
+        result.pairs, result.reduction_ratio
+
+    - field: the field compared by the default comparison, which matches records whose
+      non-blank values are equal ignoring case and surrounding whitespace
+    - normalize: a callable value -> key (None for blanks) replacing that normalization
+      in the default comparison and default blocking key; e.g. `normalize.canonical_phone`
+    - blocking: blocking keys; each is a (method, field) tuple with a method from
+      BLOCKING_METHODS, a callable returning the key for a record, or a list of those
+      (a composite key). Records are candidates if they share a key for any of them
+      (default: exact `field` values); records with a blank key are not blocked on it.
+    - compare: a callable (record_a, record_b) -> bool replacing the default comparison
+    - similarity: instead of `compare`, score every candidate pair's `field` values in
+      one batch with the similarity for a field type ("string", "email", "phone" or
+      "url"; see dataoperator.similarity); pairs scoring at least `min_similarity` match
+    - max_block_size: blocks with more records than this (e.g. "gmail.com" for an
+      email domain key) are skipped rather than compared pairwise
+    - strategy: "blocking" (default) or "sorted_neighborhood", in which each blocking
+      key is instead a sort key for one pass over the records, and records are
+      candidates if they are within `window` records of each other in any pass:
+
+        RecordMatcher(field="email", blocking=[("exact", "email"), ("exact", "lastname")], strategy="sorted_neighborhood", window=5)
+
+      or "minhash", in which records are candidates if the MinHash signatures of their
+      keys share an LSH band; `threshold` is the estimated Jaccard similarity of the
+      keys' character shingles above which records are likely to become candidates:
+
+        RecordMatcher(field="company", blocking=[("company_name", "company")], strategy="minhash", threshold=0.5)
+    """
+
+    def __init__(
+        self,
+        field: str = None,
+        blocking: list = None,
+        compare=None,
+        max_block_size: int = None,
+        strategy: str = 'blocking',
+        window: int = DEFAULT_WINDOW,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        similarity: str = None,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY,
+        normalize=None,
+    ):
+        assert field or compare, "field or compare is required"
+        self.field = field.lower() if field else None
+        self.normalize = normalize or exact_key
+        if not blocking:
+            assert self.field, "blocking keys are required without a field"
+            blocking = [self._field_key]
+        self.blocking = [_blocking_key_function(blocking_key) for blocking_key in blocking]
+        self.compare = compare or self._values_equal
+        if similarity is not None:
+            assert compare is None, "compare and similarity are mutually exclusive"
+            assert similarity in SIMILARITY_FUNCTIONS, f"Invalid similarity: {similarity}; must be one of {list(SIMILARITY_FUNCTIONS)}"
+            assert self.field, "similarity requires a field"
+            assert 0 < min_similarity <= 1, "min_similarity must be greater than 0 and at most 1"
+        self.similarity = similarity
+        self.min_similarity = min_similarity
+        assert max_block_size is None or max_block_size >= 2, "max_block_size must be at least 2"
+        self.max_block_size = max_block_size
+        assert strategy in MATCHING_STRATEGIES, f"Invalid strategy: {strategy}; must be one of {list(MATCHING_STRATEGIES)}"
+        self.strategy = strategy
+        assert isinstance(window, int) and window >= 2, "window must be an integer of at least 2"
+        self.window = window
+        if strategy == 'minhash':
+            assert 0 < threshold < 1, "threshold must be between 0 and 1"
+            self.threshold = threshold
+            self.hasher = MinHasher(num_perm)
+
+    @classmethod
+    def from_value(cls, field: str, value, normalize=None) -> "RecordMatcher":
+        """
+        A matcher configured by a `matches` operator's value: a list of blocking keys or a
+        dict of kwargs. `normalize` is the field type's key function, unless `value` has one.
+        """
+        if value is None:
+            return cls(field, normalize=normalize)
+        if isinstance(value, dict):
+            kwargs = {k: v for k, v in value.items() if k != 'field'}
+            kwargs.setdefault('normalize', normalize)
+            return cls(field=value.get('field', field), **kwargs)
+        return cls(field, blocking=value, normalize=normalize)
+
+    def _field_key(self, record) -> str:
+        return self.normalize(record.get(self.field))
+
+    def _values_equal(self, a, b) -> bool:
+        key = self._field_key(a)
+        return key is not None and key == self._field_key(b)
+
+    def blocks(self, records) -> list:
+        """ Lists of record indexes sharing a key (or an LSH bucket, for minhash), for each blocking key in turn. """
+        if self.strategy == 'minhash':
+            return self._lsh_blocks(records)
+        blocks = []
+        for key_function in self.blocking:
+            index = {}
+            for i, record in enumerate(records):
+                key = key_function(record)
+                if key is None:
+                    continue
+                block = index.get(key)
+                if block is None:
+                    index[key] = [i]
+                else:
+                    block.append(i)
+            blocks.extend(block for block in index.values() if len(block) > 1)
+        return blocks
+
+    def _lsh_blocks(self, records) -> list:
+        blocks = []
+        signature = self.hasher.signature
+        for key_function in self.blocking:
+            index = LSHIndex(self.threshold, self.hasher.num_perm)
+            for i, record in enumerate(records):
+                key = key_function(record)
+                if key is None:
+                    continue
+                index.insert(i, signature(key if isinstance(key, str) else ' '.join(map(str, key))))
+            blocks.extend(index.buckets())
+        return blocks
+
+    def candidate_pairs(self, records) -> tuple:
+        """ The set of (i, j) index pairs to compare, i < j, and the number of blocks skipped. """
+        if self.strategy == 'sorted_neighborhood':
+            return self._neighborhood_pairs(records), 0
+        return self._blocked_pairs(records)
+
+    def _blocked_pairs(self, records) -> tuple:
+        pairs = set()
+        skipped = 0
+        for block in self.blocks(records):
+            if self.max_block_size and len(block) > self.max_block_size:
+                skipped += 1
+                continue
+            for a, i in enumerate(block):
+                for j in block[a + 1:]:
+                    pairs.add((i, j))
+        return pairs, skipped
+
+    def sorted_passes(self, records) -> list:
+        """ Record indexes sorted on each blocking key in turn; records with a blank key are left out. """
+        passes = []
+        for key_function in self.blocking:
+            keyed = []
+            for i, record in enumerate(records):
+                key = key_function(record)
+                if key is not None:
+                    keyed.append((key, i))
+            keyed.sort()
+            passes.append([i for _, i in keyed])
+        return passes
+
+    def _neighborhood_pairs(self, records) -> set:
+        pairs = set()
+        window = self.window
+        for order in self.sorted_passes(records):
+            for a, i in enumerate(order):
+                for j in order[a + 1:a + window]:
+                    pairs.add((i, j) if i < j else (j, i))
+        return pairs
+
+    def match(self, records) -> MatchResult:
+        """ Compare every candidate pair of `records` (a list of records or a ColumnarRecords) once. """
+        if not isinstance(records, (list, ColumnarRecords)):
+            records = list(records)
+        candidates, skipped = self.candidate_pairs(records)
+        n = len(records)
+        if self.similarity is not None:
+            return self._match_similar(records, sorted(candidates), n, skipped)
+        compare = self.compare
+        pairs = sorted((i, j) for i, j in candidates if compare(records[i], records[j]))
+        return MatchResult(pairs, len(candidates), n * (n - 1) // 2, skipped)
+
+    def _match_similar(self, records, candidates: list, n: int, skipped: int) -> MatchResult:
+        field = self.field
+        values = [record.get(field) for record in records]
+        scores = SIMILARITY_FUNCTIONS[self.similarity](
+            [values[i] for i, _ in candidates],
+            [values[j] for _, j in candidates],
+            self.min_similarity,
+        )
+        matched = [(pair, score) for pair, score in zip(candidates, scores) if score >= self.min_similarity]
+        return MatchResult([pair for pair, _ in matched], len(candidates), n * (n - 1) // 2, skipped, [score for _, score in matched])
+
+    def __call__(self, records) -> MatchResult:
+        return self.match(records)
@@ -0,0 +1,176 @@
+from operator import itemgetter
+
+from dataoperator.columnar import ColumnarRecords
+from dataoperator.dataoperator import (
+    METHODS_BY_FIELD_TYPE,
+    METHODS_BY_OPERATOR_TYPE,
+    FIELD_TYPE_MAP,
+    find_created_datetime_field,
+    select_corporate_email,
+)
+from dataoperator.timestamps import to_epoch_microseconds
+
+
+def _has_value(values) -> bool:
+    return any(v not in ['', None] for v in values)
+
+
+def _keep_true_value(values, value):
+    return True if any(v for v in values if isinstance(v, (bool, int))) == True else None
+
+
+def _keep_false_value(values, value):
+    if _has_value(values):
+        return False if any(v for v in values if isinstance(v, (bool, int))) == False else None
+
+
+def _keep_max_value(values, value):
+    if _has_value(values):
+        return max(v for v in values if isinstance(v, (int, float)))
+
+
+def _keep_min_value(values, value):
+    if _has_value(values):
+        return min(v for v in values if isinstance(v, (int, float)))
+
+
+def _concatenate_all_values(values, value):
+    if _has_value(values):
+        return "|".join(str(v) for v in values if v not in ['', None])
+
+
+def _preserve_priority(values, value):
+    for priority_value in value:
+        if priority_value in values:
+            return priority_value
+    return None
+
+
+# merge_values methods which reduce a field's values on their own; keep_newest_value and
+# keep_oldest_value instead pick the value from the cluster's newest / oldest record, and
+# keep_corporate_domain also looks at the records' other fields
+MERGE_REDUCERS = {
+    'keep_true_value': _keep_true_value,
+    'keep_false_value': _keep_false_value,
+    'keep_max_value': _keep_max_value,
+    'keep_min_value': _keep_min_value,
+    'preserve_priority': _preserve_priority,
+    'concatenate_all_values': _concatenate_all_values,
+}
+
+
+class RecordMerger:
+    """
+    Builds a single surviving ("golden") record from a cluster of duplicate records,
+    merging each mapped field with a `merge_values` method. `spec` maps field -> method;
+    methods which need a `value` (e.g. preserve_priority) are given as a dict:
+
+        merger = RecordMerger({
+            "numberofemployees": "keep_max_value",
+            "phone": "keep_newest_value",
+            "status": {"operator": "preserve_priority", "value": ["Customer", "Prospect"]},
+            "email": {"operator": "keep_corporate_domain", "field_type": "email"},
+        })
+        merger.merge(lod)
+
+    The spec is validated once, when the merger is created. Each merge walks the cluster
+    once, collecting the mapped fields and parsing each record's created date a single time
+    for every keep_newest_value / keep_oldest_value field (or not at all, if it is already
+    in the `timestamp_cache`). Results match running a DataOperator with the same method on
+    each field. keep_corporate_domain fields use `tenant`'s email domain overlay, if given.
+    """
+
+    def __init__(self, spec: dict, datetime_field: str = None, timestamp_cache=None, tenant=None):
+        assert spec, "spec must map at least one field to a merge_values method"
+
+        self.fields = []
+        self.operators = []
+        self.values = []
+        for field, config in spec.items():
+            if not isinstance(config, dict):
+                config = {'operator': config}
+            operator = config['operator'].lower()
+            value = config.get('value')
+            field_type = config.get('field_type')
+
+            assert operator in METHODS_BY_OPERATOR_TYPE['merge_values'], f"Invalid operator: {operator}; must be one of {METHODS_BY_OPERATOR_TYPE['merge_values']}"
+            if field_type:
+                field_type = FIELD_TYPE_MAP.get(field_type.lower(), field_type.lower())
+                assert operator in METHODS_BY_FIELD_TYPE[field_type], f"Invalid operator: {operator}; must be one of {METHODS_BY_FIELD_TYPE[field_type]}"
+            if operator == 'preserve_priority':
+                assert type(value) == list
+            elif operator == 'keep_corporate_domain':
+                value = tenant
+
+            self.fields.append(field.lower())
+            self.operators.append(operator)
+            self.values.append(value)
+
+        self.datetime_field = datetime_field.lower() if datetime_field else None
+        self.timestamp_cache = timestamp_cache
+        self._uses_datetime = any(operator in ('keep_newest_value', 'keep_oldest_value') for operator in self.operators)
+        self._getter = itemgetter(*self.fields)
+
+    def __call__(self, lod: list, master: dict = None) -> dict:
+        return self.merge(lod, master)
+
+    def merge(self, lod: list, master: dict = None) -> dict:
+        """
+        Return a new record: a copy of `master` (default: the first record in `lod`)
+        with every field in the spec replaced by its merged value.
+        """
+        assert lod, "lod is required for this method"
+
+        if isinstance(lod, ColumnarRecords):
+            missing = [field for field in self.fields if field not in lod.columns]
+            assert not missing, f"Field '{missing[0]}' not found in all dictionaries"
+            columns = [lod.values(field) for field in self.fields]
+        else:
+            try:
+                rows = [self._getter(record) for record in lod]
+            except KeyError as e:
+                raise AssertionError(f"Field '{e.args[0]}' not found in all dictionaries") from e
+            columns = list(zip(*rows)) if len(self.fields) > 1 else [rows]
+
+        newest_index = oldest_index = None
+        if self._uses_datetime:
+            newest_index, oldest_index = self._newest_and_oldest(lod)
+
+        record = dict(master if master is not None else lod[0])
+        for field, operator, value, values in zip(self.fields, self.operators, self.values, columns):
+            if operator == 'keep_newest_value':
+                record[field] = values[newest_index]
+            elif operator == 'keep_oldest_value':
+                record[field] = values[oldest_index]
+            elif operator == 'keep_corporate_domain':
+                record[field] = select_corporate_email(lod, field, value)
+            else:
+                record[field] = MERGE_REDUCERS[operator](values, value)
+        return record
+
+    def _newest_and_oldest(self, lod: list):
+        """ Indexes of the first newest and first oldest record by created date """
+        datetime_field = self.datetime_field or find_created_datetime_field(lod[0])
+        parse = self.timestamp_cache.parse if self.timestamp_cache is not None else to_epoch_microseconds
+        newest = oldest = None
+        newest_index = oldest_index = None
+        stamps = lod.values(datetime_field) if isinstance(lod, ColumnarRecords) else (record[datetime_field] for record in lod)
+        for i, stamp in enumerate(stamps):
+            if stamp in ['', None]:
+                continue
+            parsed = parse(stamp)
+            if newest is None or parsed > newest:
+                newest, newest_index = parsed, i
+            if oldest is None or parsed < oldest:
+                oldest, oldest_index = parsed, i
+        if newest_index is None:
+            raise ValueError(f"No values found for datetime field '{datetime_field}'")
+        return newest_index, oldest_index
+
+
+def merge_record(lod: list, spec: dict, datetime_field: str = None, master: dict = None, timestamp_cache=None, tenant=None) -> dict:
+    """
+    Merge a cluster of duplicate records into one record in a single pass; see `RecordMerger`.
+    When merging many clusters with the same spec, create one `RecordMerger` and reuse it.
+    """
+    return RecordMerger(spec, datetime_field=datetime_field, timestamp_cache=timestamp_cache, tenant=tenant).merge(lod, master)
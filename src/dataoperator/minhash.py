@@ -0,0 +1,128 @@
+import random
+import zlib
+from functools import lru_cache
+
+from dataoperator import vectorized
+
+# MinHash signatures and a banded LSH index for fuzzy blocking: the share of equal
+# values in two MinHash signatures estimates the Jaccard similarity of the values'
+# character shingles, and splitting signatures into bands makes values which share
+# any band candidates, so similar values meet without comparing every pair.
+
+# a Mersenne prime above every 31-bit shingle hash; (a * x + b) stays below 2 ** 63, so
+# the NumPy path computes exactly the same signatures as the pure Python one
+_PRIME = (1 << 31) - 1
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.5
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> set:
+    """ The set of character `size`-grams of `text`; texts shorter than `size` are a single shingle. """
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def optimal_bands(threshold: float, num_perm: int) -> tuple:
+    """
+    (bands, rows) for an LSH index whose S-curve, the probability 1 - (1 - s ** rows) ** bands
+    that values of similarity s share a band, rises steepest closest to `threshold`.
+    """
+    assert 0 < threshold < 1, "threshold must be between 0 and 1"
+    best = None
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def estimate_similarity(signature_a: tuple, signature_b: tuple) -> float:
+    """ The Jaccard similarity estimated by two MinHash signatures. """
+    return sum(a == b for a, b in zip(signature_a, signature_b)) / len(signature_a)
+
+
+class MinHasher:
+    """
+    MinHash signatures of strings over their character shingles, using `num_perm`
+    hash functions (a * x + b) mod p seeded by `seed`, so signatures are reproducible
+    across processes. Signatures of repeated values are memoized (`cache_size` values).
+    With NumPy installed, each signature is computed in one vectorized step.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, shingle_size: int = DEFAULT_SHINGLE_SIZE, seed: int = 1, cache_size: int = 65536):
+        assert num_perm > 0, "num_perm must be positive"
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        generator = random.Random(seed)
+        self._a = [generator.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [generator.randrange(0, _PRIME) for _ in range(num_perm)]
+        self._arrays = None
+        self.signature = lru_cache(maxsize=cache_size)(self._signature)
+
+    def _hashes(self, text: str) -> list:
+        return [zlib.crc32(shingle.encode('utf-8')) % _PRIME for shingle in shingles(text, self.shingle_size)]
+
+    def _signature(self, text: str) -> tuple:
+        """ The MinHash signature of `text`: num_perm ints; all _PRIME for an empty text. """
+        hashes = self._hashes(text)
+        if not hashes:
+            return (_PRIME,) * self.num_perm
+        if vectorized.HAS_NUMPY:
+            np = vectorized._numpy()
+            if self._arrays is None:
+                self._arrays = (np.array(self._a, dtype=np.uint64)[:, None], np.array(self._b, dtype=np.uint64)[:, None])
+            a, b = self._arrays
+            return tuple(((a * np.array(hashes, dtype=np.uint64) + b) % _PRIME).min(axis=1).tolist())
+        return tuple(min((a * x + b) % _PRIME for x in hashes) for a, b in zip(self._a, self._b))
+
+
+class LSHIndex:
+    """
+    Banded locality-sensitive hashing index over MinHash signatures: keys whose
+    signatures are equal in every row of any band share a bucket. `threshold` is the
+    Jaccard similarity above which values are likely to become candidates; raising
+    it gives fewer, more similar candidates.
+
+        hasher = MinHasher()
+        index = LSHIndex(threshold=0.5)
+        for key, name in names.items():
+            index.insert(key, hasher.signature(canonical_company_name(name)))
+        index.query(hasher.signature("acme"))
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def _band_keys(self, signature: tuple):
+        assert len(signature) == self.num_perm, f"signature must have {self.num_perm} values"
+        rows = self.rows
+        for band in range(self.bands):
+            yield signature[band * rows:(band + 1) * rows]
+
+    def insert(self, key, signature: tuple):
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                buckets[band_key] = [key]
+            else:
+                bucket.append(key)
+
+    def query(self, signature: tuple) -> set:
+        """ Keys sharing at least one band with `signature`. """
+        candidates = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(band_key, ()))
+        return candidates
+
+    def buckets(self):
+        """ Each bucket holding more than one key, as a list of keys in insertion order. """
+        for buckets in self._buckets:
+            for bucket in buckets.values():
+                if len(bucket) > 1:
+                    yield bucket
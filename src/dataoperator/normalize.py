@@ -0,0 +1,257 @@
+import re
+from functools import lru_cache
+
+from dataoperator.public_suffixes import PUBLIC_SUFFIXES
+
+# Canonical keys for values which are written many different ways, so comparisons,
+# blocking and grouping can use plain equality and hashing. Every key function is
+# memoized in a bounded LRU cache, so each distinct value is normalized once.
+NORMALIZE_CACHE_SIZE = 65536
+
+# region -> (country calling code, trunk prefix, international call prefixes, national number lengths)
+# Only the rules needed to turn a national number into an international one offline;
+# numbers aren't validated beyond their length.
+PHONE_REGIONS = {
+    'US': ('1', '1', ('011',), (10,)),
+    'CA': ('1', '1', ('011',), (10,)),
+    'GB': ('44', '0', ('00',), (9, 10)),
+    'IE': ('353', '0', ('00',), (7, 8, 9)),
+    'DE': ('49', '0', ('00',), (6, 7, 8, 9, 10, 11)),
+    'FR': ('33', '0', ('00',), (9,)),
+    'ES': ('34', '', ('00',), (9,)),
+    'IT': ('39', '', ('00',), (6, 7, 8, 9, 10, 11)),
+    'NL': ('31', '0', ('00',), (9,)),
+    'AU': ('61', '0', ('0011',), (9,)),
+    'NZ': ('64', '0', ('00',), (8, 9, 10)),
+    'IN': ('91', '0', ('00',), (10,)),
+    'JP': ('81', '0', ('010',), (9, 10)),
+    'BR': ('55', '0', ('00',), (10, 11)),
+    'MX': ('52', '', ('00',), (10,)),
+}
+DEFAULT_PHONE_REGION = 'US'
+
+# numbers shorter than this are too partial to be a key; local numbers without an area
+# code (e.g. 7-digit NANP numbers) are keyed on their bare digits
+MIN_PHONE_DIGITS = 7
+MAX_PHONE_DIGITS = 15
+
+_PHONE_EXTENSION = re.compile(r'\s*(?:#|x|ext\.?|extension)\s*\d+\s*$', re.IGNORECASE)
+# a national trunk prefix written after the country code, as in "+44 (0)20 7946 0958"
+_PARENTHESIZED_TRUNK_PREFIX = re.compile(r'^(\+\s*\d{1,3})[\s.-]*\(0\)')
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _canonical_phone(value: str, region: str) -> str:
+    value = _PARENTHESIZED_TRUNK_PREFIX.sub(r'\1', _PHONE_EXTENSION.sub('', value.strip()))
+    digits = ''.join(c for c in value if c.isdigit())
+    if len(digits) < MIN_PHONE_DIGITS or len(digits) > MAX_PHONE_DIGITS + 3:
+        return None
+
+    calling_code, trunk_prefix, international_prefixes, national_lengths = PHONE_REGIONS[region]
+    if value.startswith('+'):
+        return _international_key(digits)
+    for prefix in international_prefixes:
+        if digits.startswith(prefix) and len(digits) - len(prefix) > max(national_lengths):
+            return _international_key(digits[len(prefix):])
+
+    if trunk_prefix and digits.startswith(trunk_prefix) and len(digits) - len(trunk_prefix) in national_lengths:
+        digits = digits[len(trunk_prefix):]
+    if len(digits) in national_lengths:
+        return f"+{calling_code}{digits}"
+    if len(digits) < min(national_lengths):
+        return digits
+    return _international_key(digits)
+
+
+def _international_key(digits: str) -> str:
+    """ "+" and `digits`, or None if they can't be a country code and number (no country code starts with 0). """
+    return f"+{digits}" if len(digits) <= MAX_PHONE_DIGITS and not digits.startswith('0') else None
+
+
+def canonical_phone(value, region: str = DEFAULT_PHONE_REGION) -> str:
+    """
+    An E.164-style key for a phone number, using `region`'s numbering plan for numbers
+    without a country code; e.g. "(555) 123-4567", "+1 555 123 4567", "1-555-123-4567"
+    and "555.123.4567 ext. 89" are all "+15551234567". Numbers shorter than a national
+    number are keyed on their digits ("555-0100" -> "5550100"). A "(0)" trunk prefix after
+    the country code is dropped ("+44 (0)20 7946 0958" -> "+442079460958"). None if
+    `value` has fewer than MIN_PHONE_DIGITS digits or would be keyed on a country code
+    starting with 0.
+    """
+    if value in ['', None] or isinstance(value, bool):
+        return None
+    assert region in PHONE_REGIONS, f"Invalid region: {region}; must be one of {list(PHONE_REGIONS)}"
+    # numbers stored in numeric fields are often floats; 5551234567.0 is 5551234567
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return _canonical_phone(str(value), region)
+
+
+# email provider domains which deliver to the same mailboxes as another domain
+EMAIL_DOMAIN_ALIASES = {
+    'googlemail.com': 'gmail.com',
+    'mac.com': 'icloud.com',
+    'me.com': 'icloud.com',
+}
+
+# email providers which ignore dots in the local part ("jo.smith" is "josmith")
+DOTLESS_EMAIL_DOMAINS = frozenset({'gmail.com'})
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _canonical_email(value: str) -> str:
+    local, at, domain = value.strip().lower().rpartition('@')
+    if not at or not domain:
+        return None
+    local = local.split('+', 1)[0]
+    domain = EMAIL_DOMAIN_ALIASES.get(domain, domain)
+    if domain in DOTLESS_EMAIL_DOMAINS:
+        local = local.replace('.', '')
+    return f"{local}@{domain}" if local else None
+
+
+def canonical_email(value) -> str:
+    """
+    A key for the mailbox an email address delivers to: lowercased, without a "+tag",
+    with provider aliases mapped to one domain (EMAIL_DOMAIN_ALIASES) and dots removed
+    for providers which ignore them (DOTLESS_EMAIL_DOMAINS); e.g. "Jo.Smith+news@GoogleMail.com"
+    -> "josmith@gmail.com". None if `value` isn't an email address.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    return _canonical_email(value)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _canonical_host(value: str) -> str:
+    host = value.strip().lower()
+    host = host.partition('://')[2] if '://' in host else host.lstrip('/')
+    for separator in '/?#':
+        host = host.split(separator, 1)[0]
+    host = host.rpartition('@')[2].split(':', 1)[0].rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    if not host.isascii():
+        try:
+            host = host.encode('idna').decode('ascii')
+        except UnicodeError:
+            return None
+    if '.' not in host or ' ' in host or host.startswith('.') or '..' in host:
+        return None
+    return host
+
+
+def canonical_host(value) -> str:
+    """
+    The lowercased host of a URL (or bare domain, or email address) without scheme,
+    "www.", credentials, port or path; e.g. "https://www.Acme.com/about" -> "acme.com".
+    None if `value` has no host.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    return _canonical_host(value)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _registrable_domain(host: str) -> str:
+    labels = host.split('.')
+    # the longest public suffix is the one nearest the start of the host
+    for i in range(1, len(labels) - 1):
+        if '.'.join(labels[i:]) in PUBLIC_SUFFIXES:
+            return '.'.join(labels[i - 1:])
+    return '.'.join(labels[-2:]) if host not in PUBLIC_SUFFIXES else None
+
+
+def registrable_domain(value) -> str:
+    """
+    The registrable domain of a URL's host: its public suffix (see PUBLIC_SUFFIXES) plus
+    one label; e.g. "http://shop.acme.co.uk/about" -> "acme.co.uk". None if `value` has no
+    host or its host is a public suffix.
+    """
+    host = canonical_host(value)
+    return _registrable_domain(host) if host else None
+
+
+class RegistrableDomainIndex:
+    """
+    Record ids by the registrable domain of a URL field, so records can be matched to
+    a website (e.g. leads to accounts) with a hash lookup instead of scanning URLs:
+
+        accounts = RegistrableDomainIndex.from_records(account_records, "website")
+        accounts.get("https://shop.acme.com/contact")  # ids of accounts at acme.com
+    """
+
+    def __init__(self):
+        self._ids = {}
+
+    @classmethod
+    def from_records(cls, records, field: str, id_field: str = 'id') -> "RegistrableDomainIndex":
+        index = cls()
+        field = field.lower()
+        for record in records:
+            index.add(record.get(field), record[id_field])
+        return index
+
+    def add(self, url, record_id):
+        """ Index `record_id` under the registrable domain of `url`; ignored if it has none. """
+        domain = registrable_domain(url)
+        if domain is None:
+            return
+        ids = self._ids.get(domain)
+        if ids is None:
+            self._ids[domain] = [record_id]
+        else:
+            ids.append(record_id)
+
+    def get(self, url) -> list:
+        """ Ids of the records at the registrable domain of `url`, in the order they were added. """
+        domain = registrable_domain(url)
+        return list(self._ids.get(domain, ())) if domain else []
+
+    def __contains__(self, url) -> bool:
+        return registrable_domain(url) in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+
+# legal-entity suffixes dropped from the end of company names, so "Acme Corp",
+# "ACME Corporation" and "Acme, Inc." all have the key "acme"
+LEGAL_SUFFIXES = frozenset({
+    'ag', 'bv', 'co', 'company', 'corp', 'corporation', 'gmbh', 'inc', 'incorporated',
+    'limited', 'llc', 'llp', 'lp', 'ltd', 'nv', 'oy', 'plc', 'pty', 'sa', 'sarl', 'sas',
+    'spa', 'srl',
+})
+
+_NON_ALPHANUMERIC = re.compile(r'[^0-9a-z]+')
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _canonical_company_name(value: str) -> str:
+    # suffixes are matched on whole words, so "Acme, Inc." loses "Inc." but "Big-Corp"
+    # keeps "Corp"; each word is a list of its alphanumeric parts
+    words = [_NON_ALPHANUMERIC.sub(' ', word).split() for word in value.lower().replace('&', ' and ').split()]
+    words = [parts for parts in words if parts]
+    while len(words) > 1 and (''.join(words[-1]) in LEGAL_SUFFIXES or words[-1] == ['and']):
+        words.pop()
+    return ' '.join(part for parts in words for part in parts) or None
+
+
+def canonical_company_name(value) -> str:
+    """
+    A key for a company name: lowercased, "&" spelled "and", punctuation replaced with
+    spaces and trailing legal suffixes (LEGAL_SUFFIXES) dropped; e.g. "Acme, Inc." ->
+    "acme", "Smith & Sons Co. Ltd" -> "smith and sons", "Big-Corp" -> "big corp". A
+    legal suffix on its own is kept. None if `value` has no letters or digits.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    return _canonical_company_name(value)
+
+
+# field type -> canonical key function used by equals / contains and by `matches`
+FIELD_NORMALIZERS = {
+    'email': canonical_email,
+    'phone': canonical_phone,
+    'url': registrable_domain,
+}
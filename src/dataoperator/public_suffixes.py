@@ -0,0 +1,59 @@
+# Public suffixes with more than one label, from the Public Suffix List
+# (https://publicsuffix.org/list/), for the countries and hosting providers most common
+# in CRM data. Every single-label TLD is a public suffix without being listed here.
+PUBLIC_SUFFIXES = frozenset({
+    # United Kingdom
+    "ac.uk", "co.uk", "gov.uk", "ltd.uk", "me.uk", "net.uk", "nhs.uk", "org.uk", "plc.uk", "police.uk", "sch.uk",
+    # Australia
+    "asn.au", "com.au", "edu.au", "gov.au", "id.au", "net.au", "org.au",
+    # New Zealand
+    "ac.nz", "co.nz", "geek.nz", "gen.nz", "govt.nz", "iwi.nz", "maori.nz", "net.nz", "org.nz", "school.nz",
+    # Japan
+    "ac.jp", "co.jp", "ed.jp", "go.jp", "gr.jp", "lg.jp", "ne.jp", "or.jp",
+    # South Korea
+    "ac.kr", "co.kr", "go.kr", "ne.kr", "or.kr", "re.kr",
+    # China, Hong Kong, Taiwan
+    "ac.cn", "com.cn", "edu.cn", "gov.cn", "net.cn", "org.cn",
+    "com.hk", "edu.hk", "gov.hk", "net.hk", "org.hk",
+    "com.tw", "edu.tw", "gov.tw", "net.tw", "org.tw",
+    # India
+    "ac.in", "co.in", "edu.in", "firm.in", "gen.in", "gov.in", "ind.in", "net.in", "org.in",
+    # South-east Asia
+    "com.sg", "edu.sg", "gov.sg", "net.sg", "org.sg",
+    "com.my", "edu.my", "gov.my", "net.my", "org.my",
+    "ac.id", "co.id", "go.id", "or.id", "web.id",
+    "com.ph", "edu.ph", "gov.ph", "net.ph", "org.ph",
+    "ac.th", "co.th", "go.th", "in.th", "or.th",
+    "com.vn", "edu.vn", "gov.vn", "net.vn", "org.vn",
+    # Middle East and Africa
+    "ac.il", "co.il", "gov.il", "org.il",
+    "com.sa", "edu.sa", "gov.sa", "net.sa", "org.sa",
+    "com.eg", "edu.eg", "gov.eg",
+    "ac.za", "co.za", "gov.za", "net.za", "org.za",
+    "co.ke", "or.ke",
+    "com.ng", "edu.ng", "gov.ng", "org.ng",
+    "com.pk", "edu.pk", "gov.pk", "org.pk",
+    "com.tr", "edu.tr", "gov.tr", "net.tr", "org.tr",
+    # Europe
+    "com.pl", "net.pl", "org.pl",
+    "com.ua", "net.ua", "org.ua",
+    "com.es", "org.es",
+    "co.at", "or.at",
+    "com.pt", "org.pt",
+    "com.gr", "org.gr",
+    # Americas
+    "com.ar", "edu.ar", "gob.ar", "net.ar", "org.ar",
+    "com.br", "edu.br", "gov.br", "net.br", "org.br",
+    "com.co", "edu.co", "gov.co", "net.co", "org.co",
+    "com.mx", "edu.mx", "gob.mx", "net.mx", "org.mx",
+    "com.pe", "edu.pe", "gob.pe", "org.pe",
+    "cl.cl",
+    "com.ve", "org.ve",
+    # registries selling subdomains of a generic domain
+    "ae.org", "br.com", "cn.com", "com.de", "com.se", "de.com", "eu.com", "gb.net", "hu.net", "jp.net",
+    "jpn.com", "mex.com", "ru.com", "sa.com", "se.net", "uk.com", "uk.net", "us.com", "us.org", "za.bz", "za.com",
+    # hosting providers whose customers each get a subdomain
+    "appspot.com", "azurewebsites.net", "blogspot.com", "cloudfront.net", "firebaseapp.com",
+    "github.io", "gitlab.io", "herokuapp.com", "myshopify.com", "netlify.app", "pages.dev",
+    "s3.amazonaws.com", "vercel.app", "web.app", "wixsite.com",
+})
@@ -0,0 +1,203 @@
+from dataoperator import vectorized
+from dataoperator.normalize import canonical_email, canonical_host, canonical_phone
+
+# Batch similarity scoring for candidate pairs from `matches`: each function takes
+# equal-length sequences of left and right values and a threshold, and returns one
+# score in [0, 1] per pair. Pairs which cannot reach the threshold are reported as 0.0
+# and abandoned as early as possible: first on a bound from the two lengths alone
+# (vectorized with NumPy for large batches), then, for Levenshtein, inside a DP
+# limited to the band of cells within the allowed distance.
+
+SIMILARITY_METRICS = ('jaro_winkler', 'levenshtein')
+
+# Jaro-Winkler prefix weight and the longest prefix it rewards
+_PREFIX_SCALE = 0.1
+_MAX_PREFIX = 4
+
+
+def levenshtein_within(a: str, b: str, max_distance: int) -> int:
+    """ The Levenshtein distance between `a` and `b`, or None if it is greater than `max_distance`. """
+    la, lb = len(a), len(b)
+    if abs(la - lb) > max_distance:
+        return None
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    if la == 0:
+        return lb
+
+    too_far = max_distance + 1
+    previous = list(range(lb + 1))
+    for i in range(1, la + 1):
+        lo = max(1, i - max_distance)
+        hi = min(lb, i + max_distance)
+        current = [too_far] * (lb + 1)
+        if lo == 1:
+            current[0] = i
+        row_min = current[0]
+        char = a[i - 1]
+        for j in range(lo, hi + 1):
+            distance = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < distance:
+                distance = previous[j] + 1
+            if current[j - 1] + 1 < distance:
+                distance = current[j - 1] + 1
+            current[j] = distance
+            if distance < row_min:
+                row_min = distance
+        if row_min > max_distance:
+            return None
+        previous = current
+    return previous[lb] if previous[lb] <= max_distance else None
+
+
+def levenshtein_similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """ 1 - distance / longer length; 0.0 if below `threshold`. """
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    distance = levenshtein_within(a, b, int((1 - threshold) * longest + 1e-9))
+    if distance is None:
+        return 0.0
+    similarity = 1 - distance / longest
+    return similarity if similarity >= threshold else 0.0
+
+
+def jaro(a: str, b: str) -> float:
+    if a == b:
+        return 1.0 if a else 0.0
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return 0.0
+
+    window = max(max(la, lb) // 2 - 1, 0)
+    matched = [False] * lb
+    a_matches = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(lb, i + window + 1)):
+            if not matched[j] and b[j] == char:
+                matched[j] = True
+                a_matches.append(char)
+                break
+    m = len(a_matches)
+    if not m:
+        return 0.0
+    b_matches = [char for char, is_match in zip(b, matched) if is_match]
+    transpositions = sum(x != y for x, y in zip(a_matches, b_matches)) / 2
+    return (m / la + m / lb + (m - transpositions) / m) / 3
+
+
+def jaro_winkler(a: str, b: str, threshold: float = 0.0) -> float:
+    """ Jaro-Winkler similarity; 0.0 if below `threshold`. """
+    similarity = jaro(a, b)
+    prefix = 0
+    for x, y in zip(a[:_MAX_PREFIX], b[:_MAX_PREFIX]):
+        if x != y:
+            break
+        prefix += 1
+    similarity += prefix * _PREFIX_SCALE * (1 - similarity)
+    return similarity if similarity >= threshold else 0.0
+
+
+_METRICS = {
+    'jaro_winkler': jaro_winkler,
+    'levenshtein': levenshtein_similarity,
+}
+
+
+def _upper_bound(shorter: int, longer: int, metric: str) -> float:
+    """ The highest similarity two strings of these lengths can have """
+    if metric == 'levenshtein':
+        return shorter / longer
+    bound = (shorter / longer + 1 + 1) / 3
+    return bound + _MAX_PREFIX * _PREFIX_SCALE * (1 - bound)
+
+
+def _reachable(left: list, right: list, threshold: float, metric: str) -> list:
+    """ Indexes of the pairs whose lengths allow a similarity of at least `threshold`; blanks never do. """
+    if vectorized.HAS_NUMPY and len(left) >= vectorized.VECTORIZE_MIN_RECORDS:
+        np = vectorized._numpy()
+        left_lengths = np.fromiter((len(v) if v else 0 for v in left), dtype=np.float64, count=len(left))
+        right_lengths = np.fromiter((len(v) if v else 0 for v in right), dtype=np.float64, count=len(right))
+        shorter = np.minimum(left_lengths, right_lengths)
+        longer = np.maximum(left_lengths, right_lengths)
+        ratio = np.divide(shorter, longer, out=np.zeros_like(shorter), where=longer > 0)
+        if metric == 'levenshtein':
+            bound = ratio
+        else:
+            bound = (ratio + 2) / 3
+            bound = bound + _MAX_PREFIX * _PREFIX_SCALE * (1 - bound)
+        return np.flatnonzero((shorter > 0) & (bound >= threshold)).tolist()
+
+    reachable = []
+    for k, (a, b) in enumerate(zip(left, right)):
+        if a and b:
+            la, lb = len(a), len(b)
+            if _upper_bound(min(la, lb), max(la, lb), metric) >= threshold:
+                reachable.append(k)
+    return reachable
+
+
+def similarities(left, right, threshold: float = 0.0, metric: str = 'jaro_winkler') -> list:
+    """ Similarity of each pair of (already normalized) strings; blanks and pairs below `threshold` score 0.0. """
+    assert metric in _METRICS, f"Invalid metric: {metric}; must be one of {list(SIMILARITY_METRICS)}"
+    left, right = list(left), list(right)
+    assert len(left) == len(right), "left and right must have the same length"
+    score = _METRICS[metric]
+    scores = [0.0] * len(left)
+    for k in _reachable(left, right, threshold, metric):
+        scores[k] = score(left[k], right[k], threshold)
+    return scores
+
+
+def _normalize_string(value) -> str:
+    return value.strip().lower() if isinstance(value, str) else None
+
+
+def _email_parts(value) -> tuple:
+    key = canonical_email(value)
+    if key is None:
+        return None, None
+    local, _, domain = key.rpartition('@')
+    return local, domain
+
+
+def _phone_digits(value) -> str:
+    key = canonical_phone(value)
+    return key.lstrip('+') if key is not None else None
+
+
+def string_similarities(left, right, threshold: float = 0.0) -> list:
+    """ Jaro-Winkler similarity of case-insensitive, stripped strings. """
+    return similarities(map(_normalize_string, left), map(_normalize_string, right), threshold)
+
+
+def email_similarities(left, right, threshold: float = 0.0) -> list:
+    """ Jaro-Winkler similarity of the local parts of canonical addresses at the same domain; 0.0 for different domains. """
+    left_locals = []
+    right_locals = []
+    for a, b in zip(left, right):
+        a_local, a_domain = _email_parts(a)
+        b_local, b_domain = _email_parts(b)
+        same_domain = a_domain is not None and a_domain == b_domain
+        left_locals.append(a_local if same_domain else None)
+        right_locals.append(b_local if same_domain else None)
+    return similarities(left_locals, right_locals, threshold)
+
+
+def phone_similarities(left, right, threshold: float = 0.0) -> list:
+    """ Levenshtein similarity of the digits of phone numbers' canonical keys. """
+    return similarities(map(_phone_digits, left), map(_phone_digits, right), threshold, 'levenshtein')
+
+
+def url_similarities(left, right, threshold: float = 0.0) -> list:
+    """ Levenshtein similarity of the canonical hosts of URLs, without scheme, "www.", port or path. """
+    return similarities(map(canonical_host, left), map(canonical_host, right), threshold, 'levenshtein')
+
+
+# field type -> batch similarity function, for `matches`
+SIMILARITY_FUNCTIONS = {
+    'string': string_similarities,
+    'email': email_similarities,
+    'phone': phone_similarities,
+    'url': url_similarities,
+}
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+DEFAULT_TIMESTAMP_CACHE_SIZE = 100000
+DEFAULT_TIMESTAMP_CACHE_COLUMNS = 256
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_epoch_microseconds(value) -> int:
+    """ Parse an ISO 8601 string (or datetime) to microseconds since the epoch; naive datetimes are treated as UTC. """
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - _EPOCH) // timedelta(microseconds=1)
+
+
+class TimestampCache:
+    """
+    Parsed-timestamp cache, shared by every operator run against a cluster (or a whole
+    job) so that each ISO timestamp string is parsed once; e.g.
+
+        cache = TimestampCache()
+        for field in fields:
+            DataOperator(..., lod=lod, field=field, operator="keep_newest_value", timestamp_cache=cache).execute()
+
+    Two levels are kept, both bounded:
+    - values: timestamp string -> epoch microseconds, least recently used evicted past `maxsize`
+    - columns: (lod, field) -> epoch microseconds per record (None for blanks), oldest
+      evicted past `max_columns`
+
+    The value level can never go stale. Columns are dropped by the update_field methods
+    for the field they modify; call `invalidate(field)` after changing records any other way.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_TIMESTAMP_CACHE_SIZE, max_columns: int = DEFAULT_TIMESTAMP_CACHE_COLUMNS):
+        assert maxsize > 0, "maxsize must be positive"
+        assert max_columns > 0, "max_columns must be positive"
+        self.maxsize = maxsize
+        self.max_columns = max_columns
+        self._values = OrderedDict()
+        self._columns = OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def parse(self, value: str) -> int:
+        """ Epoch microseconds for an ISO timestamp string, parsing it only on a cache miss. """
+        try:
+            epoch = self._values[value]
+        except KeyError:
+            epoch = self._values[value] = to_epoch_microseconds(value)
+            if len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        else:
+            self._values.move_to_end(value)
+        return epoch
+
+    def column(self, lod: list, field: str) -> list:
+        """ Epoch microseconds of `field` for every record in `lod`; None where the field is blank. """
+        key = (id(lod), field)
+        entry = self._columns.get(key)
+        if entry is not None and entry[0] is lod and len(entry[1]) == len(lod):
+            return entry[1]
+
+        parse = self.parse
+        epochs = [None if d[field] in ['', None] else parse(d[field]) for d in lod]
+        # keep a reference to lod so its id can't be reused by another list while cached
+        self._columns[key] = (lod, epochs)
+        if len(self._columns) > self.max_columns:
+            self._columns.popitem(last=False)
+        return epochs
+
+    def invalidate(self, field: str = None):
+        """ Drop cached columns for `field` (all columns if no field is given). """
+        if field is None:
+            self._columns.clear()
+            return
+        for key in [key for key in self._columns if key[1] == field]:
+            del self._columns[key]
+
+    def clear(self):
+        self._values.clear()
+        self._columns.clear()
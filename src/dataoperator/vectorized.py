@@ -0,0 +1,62 @@
+import importlib.util
+import re
+import warnings
+from datetime import datetime, timezone
+
+# numpy is optional (callers fall back to pure Python without it) and slow to import,
+# so it's only imported the first time a kernel runs
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+
+def _numpy():
+    import numpy
+    return numpy
+
+
+# below this many records the pure Python paths are as fast as converting to arrays
+VECTORIZE_MIN_RECORDS = 256
+
+# ISO 8601 forms which numpy and `datetime.fromisoformat` both read, and read the same
+# way; numpy also accepts e.g. "2020" or integers, which the pure Python paths reject
+_ISO_DATETIME = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{3}(?:\d{3})?)?)?(?:[+-]\d{2}:\d{2})?)?')
+
+
+def _datetime64_input(value):
+    if value in ['', None]:
+        return None
+    if isinstance(value, str) and _ISO_DATETIME.fullmatch(value):
+        return value
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+    raise ValueError(f"Unsupported datetime value: {value!r}")
+
+
+def to_datetime64(values) -> "np.ndarray":
+    """
+    Convert a sequence of ISO 8601 strings (or datetimes) to a datetime64[us] array in
+    one call; blanks ('' or None) become NaT. Values with a UTC offset are converted to
+    UTC, which matches `to_epoch_microseconds` treating naive values as UTC. Raises
+    ValueError for any other value, so callers can fall back to the pure Python path
+    and fail (or succeed) exactly as it would.
+    """
+    np = _numpy()
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+        return values.astype('datetime64[us]')
+    with warnings.catch_warnings():
+        # numpy warns that it has no timezone-aware representation; converting to UTC is intended
+        warnings.simplefilter('ignore')
+        return np.array([_datetime64_input(v) for v in values], dtype='datetime64[us]')
+
+
+def extreme_datetime_indexes(values, newest: bool) -> list:
+    """
+    Indexes of every value equal to the newest (or oldest) datetime in `values`,
+    ignoring blanks; the same ties the list comprehension implementations return.
+    """
+    np = _numpy()
+    column = to_datetime64(values)
+    present = ~np.isnat(column)
+    if not present.any():
+        raise ValueError("No datetime values found")
+    target = column[present].max() if newest else column[present].min()
+    return np.flatnonzero(column == target).tolist()
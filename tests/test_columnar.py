@@ -0,0 +1,214 @@
+import unittest
+from datetime import datetime
+
+from dataoperator import vectorized
+from dataoperator.columnar import ColumnarRecords, RowView
+from dataoperator.dataoperator import DataOperator
+from dataoperator.merge import merge_record
+from dataoperator.timestamps import TimestampCache
+
+COLUMNS = {
+    "id": ["1", "2", "3"],
+    "name": ["John", "Jane", "Bob"],
+    "age": [30, 35, 35],
+    "createddate": ["2023-01-01T12:00:00", "2023-01-03T12:00:00", ""],
+}
+
+
+class TestColumnarRecords(unittest.TestCase):
+
+    def test_rows(self):
+        records = ColumnarRecords(COLUMNS)
+        assert len(records) == 3
+        assert isinstance(records[0], RowView)
+        assert dict(records[-1]) == {"id": "3", "name": "Bob", "age": 35, "createddate": ""}
+        assert records.to_lod()[1] == {"id": "2", "name": "Jane", "age": 35, "createddate": "2023-01-03T12:00:00"}
+        with self.assertRaises(IndexError):
+            records[3]
+
+    def test_columns_must_have_same_length(self):
+        with self.assertRaises(AssertionError):
+            ColumnarRecords({"id": ["1", "2"], "name": ["John"]})
+
+    def test_from_lod(self):
+        lod = [{"id": "1", "age": 3}, {"id": "2", "age": 4}]
+        records = ColumnarRecords.from_lod(lod)
+        assert records.columns == {"id": ["1", "2"], "age": [3, 4]}
+        assert records.to_lod() == lod
+
+    def test_merge_values(self):
+        operator = DataOperator(
+            field_type="string",
+            operator_type="merge_values",
+            lod=ColumnarRecords(COLUMNS),
+            field="name",
+            operator="concatenate_all_values"
+        )
+        assert operator.execute() == "John|Jane|Bob"
+
+        operator.operator = "keep_newest_value"
+        assert operator.execute() == "Jane"
+
+    def test_select_master_record_returns_row_indexes(self):
+        records = ColumnarRecords(COLUMNS)
+        cases = {
+            ("number", "age", "keep_record_with_max_value"): [1, 2],
+            ("number", "age", "keep_record_with_min_value"): [0],
+            ("datetime", "createddate", "keep_record_with_newest_value"): [1],
+            ("datetime", "createddate", "keep_record_with_oldest_value"): [0],
+        }
+        for (field_type, field, operator_name), expected in cases.items():
+            operator = DataOperator(
+                field_type=field_type,
+                operator_type="select_master_record",
+                lod=records,
+                field=field,
+                operator=operator_name
+            )
+            self.assertEqual(operator.execute(), expected, operator_name)
+
+    def test_keep_record_by_criteria_returns_row_index(self):
+        operator = DataOperator(
+            field_type="number",
+            operator_type="select_master_record",
+            lod=ColumnarRecords(COLUMNS),
+            field="age",
+            operator="keep_record_by_criteria",
+            value=[{"rule": "max"}, {"field": "createddate", "rule": "newest"}]
+        )
+        assert operator.execute() == [1]
+
+    def test_evaluate_condition(self):
+        operator = DataOperator(
+            field_type="string",
+            operator_type="evaluate_condition",
+            lod=ColumnarRecords({"name": ["Michael"]}),
+            field="name",
+            operator="contains",
+            value="MICH"
+        )
+        assert operator.execute() == True
+
+    def test_update_field_writes_to_columns(self):
+        records = ColumnarRecords({"name": ["John", ""]})
+        DataOperator(
+            field_type="string",
+            operator_type="update_field",
+            lod=records,
+            field="name",
+            operator="update_if_blank",
+            value="Unknown"
+        ).execute()
+        assert records.columns["name"] == ["John", "Unknown"]
+
+    def test_missing_column(self):
+        with self.assertRaises(AssertionError):
+            DataOperator(
+                field_type="number",
+                operator_type="merge_values",
+                lod=ColumnarRecords(COLUMNS),
+                field="revenue",
+                operator="keep_max_value"
+            )
+
+    def test_merge_record(self):
+        record = merge_record(ColumnarRecords(COLUMNS), {"name": "keep_newest_value", "age": "keep_max_value"})
+        assert record == {"id": "1", "name": "Jane", "age": 35, "createddate": "2023-01-01T12:00:00"}
+
+
+@unittest.skipUnless(vectorized.HAS_NUMPY, "numpy is not installed")
+class TestColumnarRecordsNumpy(unittest.TestCase):
+
+    def test_numpy_values_are_python_scalars(self):
+        np = vectorized._numpy()
+        records = ColumnarRecords({"age": np.array([30, 35, 25]), "score": np.array([1.5, 0.5, 2.5])})
+        assert type(records[0]["age"]) is int
+        operator = DataOperator(
+            field_type="number",
+            operator_type="merge_values",
+            lod=records,
+            field="age",
+            operator="keep_max_value"
+        )
+        assert operator.execute() == 35
+
+    def test_datetime64_column(self):
+        np = vectorized._numpy()
+        size = vectorized.VECTORIZE_MIN_RECORDS + 1
+        created = np.array(["2020-01-01T00:00:00"] * size, dtype="datetime64[us]")
+        created[7] = np.datetime64("2021-01-01T00:00:00")
+        created[9] = np.datetime64("NaT")
+        records = ColumnarRecords({"id": np.arange(size), "createddate": created})
+        for lod in (records, ColumnarRecords({"id": records.column("id")[:10], "createddate": created[:10]})):
+            operator = DataOperator(
+                field_type="datetime",
+                operator_type="select_master_record",
+                lod=lod,
+                field="createddate",
+                operator="keep_record_with_newest_value"
+            )
+            assert operator.execute() == [7]
+
+    def test_datetime64_columns_in_any_unit(self):
+        np = vectorized._numpy()
+        for unit in ("ns", "D"):
+            for size in (10, vectorized.VECTORIZE_MIN_RECORDS + 1):
+                created = np.array(["2020-01-01"] * size, dtype=f"datetime64[{unit}]")
+                created[7] = np.datetime64("2021-01-01")
+                created[9] = np.datetime64("NaT")
+                records = ColumnarRecords({"id": np.arange(size), "name": ["Jane"] * 7 + ["John"] + ["Jane"] * (size - 8), "createddate": created})
+                for timestamp_cache in (None, TimestampCache()):
+                    operator = DataOperator(
+                        field_type="datetime",
+                        operator_type="select_master_record",
+                        lod=records,
+                        field="createddate",
+                        operator="keep_record_with_newest_value",
+                        timestamp_cache=timestamp_cache
+                    )
+                    assert operator.execute() == [7], (unit, size)
+                    operator = DataOperator(
+                        field_type="string",
+                        operator_type="merge_values",
+                        lod=records,
+                        field="name",
+                        operator="keep_newest_value",
+                        timestamp_cache=timestamp_cache
+                    )
+                    assert operator.execute() == "John", (unit, size)
+                record = merge_record(records, {"name": "keep_newest_value", "createddate": "keep_oldest_value"})
+                assert record["name"] == "John", (unit, size)
+                assert records[0]["createddate"] == datetime(2020, 1, 1)
+
+    def test_update_field_rejects_typed_array_columns(self):
+        np = vectorized._numpy()
+        records = ColumnarRecords({"name": np.array(["J", ""])})
+        with self.assertRaises(AssertionError):
+            DataOperator(
+                field_type="string",
+                operator_type="update_field",
+                lod=records,
+                field="name",
+                operator="update_if_blank",
+                value="Unknown"
+            )
+        with self.assertRaises(AssertionError):
+            records[1]["name"] = "Unknown"
+        assert records.columns["name"].tolist() == ["J", ""]
+
+    def test_update_field_writes_to_object_array_columns(self):
+        np = vectorized._numpy()
+        records = ColumnarRecords({"name": np.array(["J", ""], dtype=object)})
+        DataOperator(
+            field_type="string",
+            operator_type="update_field",
+            lod=records,
+            field="name",
+            operator="update_if_blank",
+            value="Unknown"
+        ).execute()
+        assert records.columns["name"].tolist() == ["J", "Unknown"]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+from dataoperator.columnar import ColumnarRecords
+from dataoperator.dataoperator import DataOperator
+from dataoperator.dedupe import DedupeEngine
+
+RECORDS = [
+    {"id": "1", "email": "pat@bigcorp.co", "numberofemployees": 10, "phone": "555-0100", "createddate": "2021-01-01T00:00:00"},
+    {"id": "2", "email": "sam@acme.com", "numberofemployees": 5, "phone": "555-0200", "createddate": "2021-01-01T00:00:00"},
+    {"id": "3", "email": "pat@bigcorp.co", "numberofemployees": 250, "phone": "", "createddate": "2020-01-01T00:00:00"},
+    {"id": "4", "email": "", "numberofemployees": 1, "phone": "555-0400", "createddate": "2021-01-01T00:00:00"},
+    {"id": "5", "email": "pat@bigcorp.co", "numberofemployees": 30, "phone": "555-0500", "createddate": "2022-01-01T00:00:00"},
+    {"id": "6", "email": None, "numberofemployees": 2, "phone": "555-0600", "createddate": "2021-01-01T00:00:00"},
+]
+
+
+class TestDedupeEngine(unittest.TestCase):
+
+    def test_group(self):
+        clusters = DedupeEngine(key="Email").group(RECORDS)
+        assert [[record["id"] for record in cluster] for cluster in clusters] == [["1", "3", "5"], ["2"], ["4"], ["6"]]
+
+    def test_group_callable_key(self):
+        clusters = DedupeEngine(key=lambda record: record["email"].split("@")[-1] if record["email"] else None).group(RECORDS)
+        assert len(clusters) == 4
+
+    def test_execute(self):
+        engine = DedupeEngine(
+            key="email",
+            survivorship={"field_type": "number", "operator": "keep_record_with_max_value", "field": "numberofemployees"},
+            merge_spec={"phone": "keep_newest_value", "numberofemployees": "keep_min_value"},
+        )
+        golden_records = engine.execute(RECORDS)
+        assert [record["id"] for record in golden_records] == ["3", "2", "4", "6"]
+        assert golden_records[0]["phone"] == "555-0500"
+        assert golden_records[0]["numberofemployees"] == 10
+        assert golden_records[1] == RECORDS[1]
+        assert golden_records[1] is not RECORDS[1]
+
+    def test_execute_without_survivorship_or_merge(self):
+        golden_records = DedupeEngine(key="email").execute(RECORDS)
+        assert [record["id"] for record in golden_records] == ["1", "2", "4", "6"]
+
+    def test_execute_with_compiled_survivorship(self):
+        survivorship = DataOperator.compile("datetime", "select_master_record", "keep_record_with_newest_value", "createddate")
+        golden_records = DedupeEngine(key="email", survivorship=survivorship).execute(iter(RECORDS))
+        assert golden_records[0]["id"] == "5"
+
+    def test_execute_columnar(self):
+        records = ColumnarRecords.from_lod(RECORDS)
+        engine = DedupeEngine(
+            key="email",
+            survivorship={"field_type": "number", "operator": "keep_record_by_criteria", "field": "numberofemployees", "value": [{"rule": "max"}]},
+            merge_spec={"phone": "keep_newest_value"},
+        )
+        golden_records = engine.execute(records)
+        assert golden_records[0]["id"] == "3"
+        assert golden_records[0]["phone"] == "555-0500"
+        assert golden_records[3] == RECORDS[5]
+
+    def test_invalid_survivorship(self):
+        with self.assertRaises(AssertionError):
+            DedupeEngine(key="email", survivorship={"field_type": "number", "operator_type": "merge_values", "operator": "keep_max_value", "field": "numberofemployees"})
+        with self.assertRaises(AssertionError):
+            DedupeEngine(key="email", survivorship={"field_type": "number", "operator": "keep_max_value", "field": "numberofemployees"})
+
+    def test_group_normalized_email(self):
+        records = [
+            {'id': '1', 'email': 'Jo.Smith+news@gmail.com'},
+            {'id': '2', 'email': 'josmith@googlemail.com'},
+            {'id': '3', 'email': 'JO.SMITH@bigcorp.co'},
+            {'id': '4', 'email': 'jo.smith+crm@bigcorp.co'},
+            {'id': '5', 'email': 'not-an-email'},
+            {'id': '6', 'email': 'not-an-email'},
+        ]
+        clusters = DedupeEngine(key="email", normalize="email").group(records)
+        assert [[record['id'] for record in cluster] for cluster in clusters] == [['1', '2'], ['3', '4'], ['5'], ['6']]
+        clusters = DedupeEngine(key="email", normalize=str.lower).group(records)
+        assert len(clusters) == 5
+
+    def test_invalid_normalize(self):
+        with self.assertRaises(AssertionError):
+            DedupeEngine(key="email", normalize="date")
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from dataoperator import email_domains
+from dataoperator.domain_db import DomainDB, write_domain_db
+from dataoperator.email_domains import CORPORATE, DISPOSABLE, FREE
+
+
+class TestDomainDB(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "email_domains.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        # forget domains classified while a test database was loaded
+        email_domains._classify_domain.cache_clear()
+
+    def test_write_and_read(self):
+        index = {"gmail.com": FREE, "mailinator.com": DISPOSABLE, "bücher.de": FREE}
+        assert write_domain_db(self.path, index) == 3
+        with DomainDB(self.path) as db:
+            assert len(db) == 3
+            assert db["gmail.com"] == FREE
+            assert db.get("mailinator.com") == DISPOSABLE
+            assert db.get("bigcorp.co") is None
+            assert "bücher.de" in db
+            assert "aaa.com" not in db and "zzz.com" not in db
+            assert dict(db) == index
+            with self.assertRaises(KeyError):
+                db["bigcorp.co"]
+
+    def test_built_in_lists(self):
+        count = write_domain_db(self.path)
+        with DomainDB(self.path) as db:
+            assert len(db) == count
+            for domain, category in email_domains.DOMAIN_INDEX.items():
+                assert db[domain] == category
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a domain database")
+        with self.assertRaises(ValueError):
+            DomainDB(self.path)
+
+    def test_preload_db_path(self):
+        write_domain_db(self.path, {"bigcorp.co": FREE})
+        with mock.patch.object(email_domains, "_DOMAIN_INDEX", None):
+            email_domains.preload(db_path=self.path)
+            assert isinstance(email_domains._DOMAIN_INDEX, DomainDB)
+            assert email_domains.classify_email("pat@eu.bigcorp.co") == FREE
+            assert email_domains.classify_email("pat@gmail.com") == CORPORATE
+            email_domains._DOMAIN_INDEX.close()
+
+    def test_env_var(self):
+        write_domain_db(self.path, {"bigcorp.co": DISPOSABLE})
+        with mock.patch.object(email_domains, "_DOMAIN_INDEX", None), \
+                mock.patch.dict(os.environ, {email_domains.DOMAIN_DB_ENV_VAR: self.path}):
+            assert email_domains.classify_email_domain("bigcorp.co") == DISPOSABLE
+            email_domains._DOMAIN_INDEX.close()
+
+    def test_preload_replaces_previous_db(self):
+        other_path = os.path.join(self.tmp_dir.name, "other.db")
+        write_domain_db(self.path, {"bigcorp.co": FREE})
+        write_domain_db(other_path, {"bigcorp.co": DISPOSABLE})
+        with mock.patch.object(email_domains, "_DOMAIN_INDEX", None):
+            email_domains.preload(db_path=self.path)
+            first = email_domains._DOMAIN_INDEX
+            assert email_domains.classify_email_domain("bigcorp.co") == FREE
+            # without a db_path the loaded database is kept, not reopened
+            email_domains.preload()
+            assert email_domains._DOMAIN_INDEX is first
+            proxy = email_domains.DOMAIN_INDEX
+            email_domains.preload(db_path=other_path)
+            assert email_domains.classify_email_domain("bigcorp.co") == DISPOSABLE
+            # references taken before the swap still answer from the old database
+            assert first.get("bigcorp.co") == FREE
+            assert proxy["bigcorp.co"] == FREE
+            email_domains._DOMAIN_INDEX.close()
+            first.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
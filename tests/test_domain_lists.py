@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from dataoperator.disposable_email_domains import DISPOSABLE_EMAIL_DOMAINS
+from dataoperator.domain_lists import compile_domain_lists, parse_domain_list, render_domain_module
+from dataoperator.email_domains import DISPOSABLE, classify_email
+
+
+class TestDomainLists(unittest.TestCase):
+
+    def test_parse_domain_list(self):
+        lines = [
+            "# comment",
+            "",
+            "Gmail.COM ",
+            "gmail.com  # duplicate",
+            "mail.example.co.uk.",
+            "bücher.de",
+        ]
+        assert parse_domain_list(lines) == ["gmail.com", "mail.example.co.uk", "xn--bcher-kva.de"]
+
+    def test_parse_domain_list_rejects_malformed_entries(self):
+        lines = ["ok.com", '"0-mail.com"', "no-tld", "-bad.com", "two words.com", "a" * 64 + ".com"]
+        with self.assertRaises(ValueError) as context:
+            parse_domain_list(lines, "free_email_domains.txt")
+        message = str(context.exception)
+        for line_number in (2, 3, 4, 5, 6):
+            assert f"free_email_domains.txt:{line_number}:" in message
+        assert "free_email_domains.txt:1:" not in message
+
+    def test_render_domain_module(self):
+        namespace = {}
+        exec(render_domain_module("DOMAINS", ["a.com", "b.com"], "domains.txt"), namespace)
+        assert namespace["DOMAINS"] == frozenset({"a.com", "b.com"})
+
+    def test_generated_modules_are_up_to_date(self):
+        compiled = compile_domain_lists(check=True)
+        assert frozenset(compiled["DISPOSABLE_EMAIL_DOMAINS"]) == DISPOSABLE_EMAIL_DOMAINS
+
+    def test_compile_domain_lists(self):
+        with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as output_dir:
+            for name in ("free_email_domains.txt", "disposable_email_domains.txt"):
+                with open(os.path.join(source_dir, name), "w") as f:
+                    f.write("b.com\na.com\n")
+            compile_domain_lists(source_dir, output_dir)
+            assert sorted(os.listdir(output_dir)) == ["disposable_email_domains.py", "free_email_domains.py"]
+            compile_domain_lists(source_dir, output_dir, check=True)
+
+            with open(os.path.join(source_dir, "free_email_domains.txt"), "a") as f:
+                f.write("c.com\n")
+            with self.assertRaises(ValueError):
+                compile_domain_lists(source_dir, output_dir, check=True)
+
+    def test_disposable_domains_are_matched(self):
+        assert len(DISPOSABLE_EMAIL_DOMAINS) > 1000
+        assert classify_email("jose.conseco@mailinator.com") == DISPOSABLE
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from dataoperator import email_domains
+from dataoperator.email_domains import (
+    CORPORATE,
+    DISPOSABLE,
+    DOMAIN_INDEX,
+    FREE,
+    INVALID,
+    classify_email,
+    classify_email_domain,
+    classify_emails,
+    email_domain,
+    get_tenant_overlay,
+    iter_classify_emails,
+    remove_tenant_overlay,
+    set_tenant_overlay,
+)
+
+
+class TestEmailDomains(unittest.TestCase):
+
+    def test_email_domain(self):
+        assert email_domain("Jose.Conseco@Gmail.COM") == "gmail.com"
+        assert email_domain("odd@name@example.org") == "example.org"
+        assert email_domain("not-an-email") is None
+
+    def test_classify_email_domain(self):
+        assert classify_email_domain("gmail.com") == FREE
+        assert classify_email_domain("YAHOO.com") == FREE
+        assert classify_email_domain("bigcorp.co") == CORPORATE
+
+    def test_classify_email(self):
+        assert classify_email("jose@gmail.com") == FREE
+        assert classify_email("jose@bigcorp.co") == CORPORATE
+        assert classify_email("jose") is None
+
+    def test_domain_index_is_read_only(self):
+        assert DOMAIN_INDEX["gmail.com"] == FREE
+        assert set(DOMAIN_INDEX.values()) <= {FREE, DISPOSABLE}
+        with self.assertRaises(TypeError):
+            DOMAIN_INDEX["bigcorp.co"] = FREE
+
+    def test_classify_email_domain_subdomains(self):
+        assert classify_email_domain("mail.yahoo.co.uk") == FREE
+        assert classify_email_domain("a.b.cinci.rr.com") == FREE
+        assert classify_email_domain("eu.acme.com") == CORPORATE
+        assert classify_email_domain("co.uk") == CORPORATE
+        assert classify_email("pat@Mail.Yahoo.co.uk") == FREE
+
+    def test_classify_email_domain_stops_at_public_suffixes(self):
+        assert classify_email_domain("za.com") == FREE
+        assert classify_email_domain("acme.za.com") == CORPORATE
+        assert classify_email_domain("mail.acme.za.com") == CORPORATE
+        assert classify_email("pat@acme.za.com") == CORPORATE
+
+    def test_classify_email_domain_exact_only(self):
+        assert classify_email_domain("mail.yahoo.co.uk", match_subdomains=False) == CORPORATE
+        assert classify_email("pat@yahoo.co.uk", match_subdomains=False) == FREE
+
+    def test_domain_lists_are_loaded_lazily(self):
+        code = (
+            "import sys\n"
+            "from dataoperator.dataoperator import DataOperator\n"
+            "from dataoperator import email_domains\n"
+            "assert 'dataoperator.free_email_domains' not in sys.modules\n"
+            "email_domains.preload()\n"
+            "assert 'dataoperator.free_email_domains' in sys.modules\n"
+            "from dataoperator.dataoperator import FREE_EMAIL_DOMAINS\n"
+            "assert 'gmail.com' in FREE_EMAIL_DOMAINS\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_classify_emails(self):
+        emails = [
+            "pat@bigcorp.co",
+            "Pat@GMAIL.com",
+            "pat@mailinator.com",
+            "not-an-email",
+            "@gmail.com",
+            "pat@localhost",
+            None,
+            "pat@mail.yahoo.co.uk",
+        ]
+        assert classify_emails(emails) == [CORPORATE, FREE, DISPOSABLE, INVALID, INVALID, INVALID, INVALID, FREE]
+
+    def test_iter_classify_emails_is_lazy(self):
+        results = iter_classify_emails(iter(["pat@gmail.com", "pat@bigcorp.co"]))
+        assert next(results) == FREE
+        assert next(results) == CORPORATE
+
+    def test_classify_emails_memoizes_domains(self):
+        classify_emails(["warmup@example-one.com"])
+        info = email_domains._classify_domain.cache_info()
+        classify_emails(["a@example-one.com", "b@example-one.com", "c@example-two.com"])
+        after = email_domains._classify_domain.cache_info()
+        assert after.hits - info.hits == 2
+        assert after.misses - info.misses == 1
+        assert after.maxsize == email_domains.CLASSIFY_CACHE_SIZE
+
+    def test_tenant_overlay(self):
+        set_tenant_overlay("acme", allow=["Yahoo.co.uk"], block=["bigcorp.co"])
+        try:
+            assert classify_email("pat@yahoo.co.uk", tenant="acme") == CORPORATE
+            assert classify_email("pat@mail.yahoo.co.uk", tenant="acme") == CORPORATE
+            assert classify_email("pat@bigcorp.co", tenant="acme") == DISPOSABLE
+            assert classify_email("pat@gmail.com", tenant="acme") == FREE
+            assert classify_email_domain("yahoo.co.uk", tenant="acme") == CORPORATE
+            assert classify_emails(["pat@yahoo.co.uk", "pat@gmail.com", "nope"], tenant="acme") == [CORPORATE, FREE, INVALID]
+            # other tenants and tenant-less lookups use the built-in index
+            assert classify_email("pat@yahoo.co.uk") == FREE
+            assert classify_email("pat@yahoo.co.uk", tenant="globex") == FREE
+            assert classify_email("pat@bigcorp.co") == CORPORATE
+        finally:
+            remove_tenant_overlay("acme")
+        assert classify_email("pat@yahoo.co.uk", tenant="acme") == FREE
+
+    def test_tenant_overlay_swap(self):
+        set_tenant_overlay("acme", allow=["yahoo.co.uk"])
+        try:
+            overlay = get_tenant_overlay("acme")
+            set_tenant_overlay("acme", block=["bigcorp.co"], block_category=FREE)
+            # the previous overlay is replaced, not mutated
+            assert dict(overlay) == {"yahoo.co.uk": CORPORATE}
+            assert dict(get_tenant_overlay("acme")) == {"bigcorp.co": FREE}
+            assert classify_email("pat@yahoo.co.uk", tenant="acme") == FREE
+            assert classify_email("pat@bigcorp.co", tenant="acme") == FREE
+            with self.assertRaises(TypeError):
+                get_tenant_overlay("acme")["bigcorp.co"] = CORPORATE
+            with self.assertRaises(AssertionError):
+                set_tenant_overlay("acme", block=["bigcorp.co"], block_category=CORPORATE)
+        finally:
+            remove_tenant_overlay("acme")
+        assert dict(get_tenant_overlay("acme")) == {}
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,318 @@
+import os
+import subprocess
+import sys
+import unittest
+from dataoperator.columnar import ColumnarRecords
+from dataoperator.dataoperator import DataOperator
+from dataoperator.matching import (
+    MatchResult,
+    RecordMatcher,
+    email_domain_key,
+    phone_last7_key,
+    soundex,
+)
+
+LEADS = [
+    {'id': '00Q1', 'email': 'pat@bigcorp.co', 'lastname': 'Robert', 'phone': '+1 (415) 555-0100'},
+    {'id': '00Q2', 'email': 'PAT@bigcorp.co ', 'lastname': 'Rupert', 'phone': '555 0100'},
+    {'id': '00Q3', 'email': 'sam@bigcorp.co', 'lastname': 'Smith', 'phone': ''},
+    {'id': '00Q4', 'email': 'pat@gmail.com', 'lastname': 'Robert', 'phone': '415-555-0100'},
+    {'id': '00Q5', 'email': '', 'lastname': '', 'phone': None},
+]
+
+
+class TestBlockingKeys(unittest.TestCase):
+
+    def test_soundex(self):
+        assert soundex("Robert") == soundex("Rupert") == "R163"
+        assert soundex("Tymczak") == "T522"
+        assert soundex("Pfister") == "P236"
+        assert soundex("Ashcraft") == "A261"
+        assert soundex("Lee") == "L000"
+        assert soundex("1234") is None
+
+    def test_email_domain_key(self):
+        assert email_domain_key("Pat@BigCorp.co") == "bigcorp.co"
+        assert email_domain_key("not-an-email") is None
+        assert email_domain_key(None) is None
+
+    def test_phone_last7_key(self):
+        assert phone_last7_key("+1 (415) 555-0100") == phone_last7_key("555.0100") == "5550100"
+        assert phone_last7_key("555-01") is None
+        assert phone_last7_key(None) is None
+
+
+class TestRecordMatcher(unittest.TestCase):
+
+    def test_match_exact_field(self):
+        result = RecordMatcher(field="email").match(LEADS)
+        assert isinstance(result, MatchResult)
+        assert result.pairs == [(0, 1)]
+        assert result.candidate_pairs == 1
+        assert result.total_pairs == 10
+        assert result.reduction_ratio == 0.9
+
+    def test_match_blocking_keys(self):
+        matcher = RecordMatcher(
+            field="phone",
+            blocking=[("email_domain", "email"), ("soundex", "lastname")],
+            compare=lambda a, b: phone_last7_key(a['phone']) is not None and phone_last7_key(a['phone']) == phone_last7_key(b['phone']),
+        )
+        result = matcher.match(LEADS)
+        # bigcorp.co: (0, 1), (0, 2), (1, 2); R163: (0, 1), (0, 3), (1, 3)
+        assert result.candidate_pairs == 5
+        assert result.pairs == [(0, 1), (0, 3), (1, 3)]
+
+    def test_match_callable_blocking_key(self):
+        matcher = RecordMatcher(field="lastname", blocking=[lambda record: record['lastname'][:1] or None])
+        assert matcher.match(LEADS).pairs == [(0, 3)]
+
+    def test_max_block_size(self):
+        result = RecordMatcher(field="email", blocking=[("email_domain", "email")], max_block_size=2).match(LEADS)
+        assert result.skipped_blocks == 1
+        assert result.candidate_pairs == 0
+        assert result.reduction_ratio == 1.0
+
+    def test_match_columnar(self):
+        result = RecordMatcher(field="email").match(ColumnarRecords.from_lod(LEADS))
+        assert result.pairs == [(0, 1)]
+
+    def test_invalid_blocking_key(self):
+        with self.assertRaises(AssertionError):
+            RecordMatcher(field="email", blocking=[("metaphone", "lastname")])
+        with self.assertRaises(AssertionError):
+            RecordMatcher(field="email", blocking=["email"])
+
+    def test_matches_operator(self):
+        operator = DataOperator(
+            field_type="email",
+            operator_type="match_condition",
+            lod=LEADS,
+            field="email",
+            operator="matches",
+            value=[("email_domain", "email")],
+        )
+        result = operator.execute()
+        assert result.pairs == [(0, 1)]
+        assert result.candidate_pairs == 3
+
+    def test_matching_is_imported_lazily(self):
+        code = (
+            "import sys\n"
+            "from dataoperator.dataoperator import DataOperator\n"
+            "assert 'dataoperator.matching' not in sys.modules\n"
+            "assert 'dataoperator.normalize' not in sys.modules\n"
+            "DataOperator(field_type='email', operator_type='match_condition', lod=[{'email': 'a@acme.com'}], field='email', operator='matches').execute()\n"
+            "assert 'dataoperator.matching' in sys.modules\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+    def test_matches_operator_dict_value(self):
+        operator = DataOperator(
+            field_type="string",
+            operator_type="match_condition",
+            lod=LEADS,
+            field="lastname",
+            operator="matches",
+            value={"blocking": [("soundex", "lastname")], "max_block_size": 10},
+        )
+        assert operator.execute().pairs == [(0, 3)]
+
+
+class TestSortedNeighborhood(unittest.TestCase):
+
+    RECORDS = [
+        {'id': '1', 'email': 'jon.smith@bigcorp.co', 'lastname': 'Smith'},
+        {'id': '2', 'email': 'ann@acme.io', 'lastname': 'Jones'},
+        {'id': '3', 'email': 'jon.smiht@bigcorp.co', 'lastname': 'Smith'},
+        {'id': '4', 'email': 'zed@zeta.com', 'lastname': 'Adams'},
+        {'id': '5', 'email': 'jon.smith@bigcorp.co ', 'lastname': 'Smyth'},
+    ]
+
+    def test_window_catches_typos(self):
+        same_person = lambda a, b: a['email'][:7] == b['email'][:7]
+        blocking = RecordMatcher(field="email", blocking=[("exact", "email")], compare=same_person).match(self.RECORDS)
+        assert blocking.pairs == [(0, 4)]
+
+        matcher = RecordMatcher(field="email", blocking=[("exact", "email")], compare=same_person, strategy="sorted_neighborhood", window=3)
+        # sorted: ann, jon.smiht, jon.smith, jon.smith, zed
+        assert matcher.sorted_passes(self.RECORDS) == [[1, 2, 0, 4, 3]]
+        result = matcher.match(self.RECORDS)
+        assert result.pairs == [(0, 2), (0, 4), (2, 4)]
+        assert result.candidate_pairs == 7
+        assert result.skipped_blocks == 0
+
+    def test_window_size(self):
+        matcher = RecordMatcher(field="email", blocking=[("exact", "email")], strategy="sorted_neighborhood", window=2)
+        assert matcher.match(self.RECORDS).candidate_pairs == 4
+        matcher = RecordMatcher(field="email", blocking=[("exact", "email")], strategy="sorted_neighborhood", window=5)
+        assert matcher.match(self.RECORDS).candidate_pairs == 10
+
+    def test_multiple_passes_are_merged(self):
+        keys = [("exact", "email"), ("soundex", "lastname")]
+        compare = lambda a, b: True
+        first = RecordMatcher(field="email", blocking=keys[:1], compare=compare, strategy="sorted_neighborhood", window=2).match(self.RECORDS)
+        second = RecordMatcher(field="email", blocking=keys[1:], compare=compare, strategy="sorted_neighborhood", window=2).match(self.RECORDS)
+        both = RecordMatcher(field="email", blocking=keys, compare=compare, strategy="sorted_neighborhood", window=2).match(self.RECORDS)
+        assert both.pairs == sorted(set(first.pairs) | set(second.pairs))
+
+    def test_composite_key(self):
+        matcher = RecordMatcher(field="email", blocking=[[("email_domain", "email"), ("soundex", "lastname")]])
+        # bigcorp.co + S530 (Smith, Smyth)
+        assert matcher.match(self.RECORDS).candidate_pairs == 3
+
+    def test_invalid_strategy(self):
+        with self.assertRaises(AssertionError):
+            RecordMatcher(field="email", strategy="canopy")
+        with self.assertRaises(AssertionError):
+            RecordMatcher(field="email", strategy="sorted_neighborhood", window=1)
+
+    def test_matches_operator_sorted_neighborhood(self):
+        operator = DataOperator(
+            field_type="email",
+            operator_type="match_condition",
+            lod=self.RECORDS,
+            field="email",
+            operator="matches",
+            value={"strategy": "sorted_neighborhood", "window": 3},
+        )
+        assert operator.execute().pairs == [(0, 4)]
+
+class TestMinHashBlocking(unittest.TestCase):
+
+    ACCOUNTS = [
+        {'id': '1', 'company': 'Acme Corp'},
+        {'id': '2', 'company': 'ACME Corporation'},
+        {'id': '3', 'company': 'Globex International'},
+        {'id': '4', 'company': 'Acme, Inc.'},
+        {'id': '5', 'company': 'Globex Internationl'},
+        {'id': '6', 'company': ''},
+    ]
+
+    def test_company_name_blocking(self):
+        compare = lambda a, b: True
+        exact = RecordMatcher(field="company", compare=compare).match(self.ACCOUNTS)
+        assert exact.candidate_pairs == 0
+
+        matcher = RecordMatcher(field="company", blocking=[("company_name", "company")], compare=compare, strategy="minhash")
+        result = matcher.match(self.ACCOUNTS)
+        assert result.pairs == [(0, 1), (0, 3), (1, 3), (2, 4)]
+        assert result.reduction_ratio > 0.7
+
+    def test_threshold(self):
+        with self.assertRaises(AssertionError):
+            RecordMatcher(field="company", strategy="minhash", threshold=0)
+        strict = RecordMatcher(field="company", blocking=[("company_name", "company")], compare=lambda a, b: True, strategy="minhash", threshold=0.95)
+        assert strict.match(self.ACCOUNTS).pairs == [(0, 1), (0, 3), (1, 3)]
+
+    def test_matches_operator_minhash(self):
+        operator = DataOperator(
+            field_type="string",
+            operator_type="match_condition",
+            lod=self.ACCOUNTS,
+            field="company",
+            operator="matches",
+            value={"strategy": "minhash", "blocking": [("company_name", "company")], "compare": lambda a, b: True},
+        )
+        assert operator.execute().candidate_pairs == 4
+
+class TestSimilarityMatching(unittest.TestCase):
+
+    def test_match_similarity(self):
+        records = [
+            {'id': '1', 'email': 'jon.smith@bigcorp.co'},
+            {'id': '2', 'email': 'jon.smiht@bigcorp.co'},
+            {'id': '3', 'email': 'ann.jones@bigcorp.co'},
+        ]
+        matcher = RecordMatcher(field="email", blocking=[("email_domain", "email")], similarity="email", min_similarity=0.9)
+        result = matcher.match(records)
+        assert result.candidate_pairs == 3
+        assert result.pairs == [(0, 1)]
+        assert len(result.scores) == 1 and result.scores[0] > 0.9
+
+    def test_invalid_similarity(self):
+        with self.assertRaises(AssertionError):
+            RecordMatcher(field="email", similarity="date")
+        with self.assertRaises(AssertionError):
+            RecordMatcher(field="email", similarity="email", compare=lambda a, b: True)
+
+class TestPhoneMatching(unittest.TestCase):
+
+    def test_matches_phone_field(self):
+        records = [
+            {'id': '1', 'phone': '(555) 123-4567'},
+            {'id': '2', 'phone': '+1 555 123 4567'},
+            {'id': '3', 'phone': '5551234567 ext. 2'},
+            {'id': '4', 'phone': '555-765-4321'},
+        ]
+        operator = DataOperator(
+            field_type="phone",
+            operator_type="match_condition",
+            lod=records,
+            field="phone",
+            operator="matches",
+        )
+        result = operator.execute()
+        assert result.pairs == [(0, 1), (0, 2), (1, 2)]
+        assert result.candidate_pairs == 3
+
+    def test_phone_blocking(self):
+        records = [{'phone': '(555) 123-4567'}, {'phone': '+1 555 123 4567'}, {'phone': '555 123 4567 x 99'}]
+        matcher = RecordMatcher(field="phone", blocking=[("phone", "phone")], compare=lambda a, b: True)
+        assert matcher.match(records).candidate_pairs == 3
+        assert phone_last7_key("555 123 4567 x 99") == "1234567"
+
+class TestUrlMatching(unittest.TestCase):
+
+    def test_matches_url_field(self):
+        records = [
+            {'id': '1', 'website': 'https://www.Acme.com/'},
+            {'id': '2', 'website': 'acme.com'},
+            {'id': '3', 'website': 'http://acme.com/about'},
+            {'id': '4', 'website': 'acme.co.uk'},
+        ]
+        operator = DataOperator(
+            field_type="url",
+            operator_type="match_condition",
+            lod=records,
+            field="website",
+            operator="matches",
+        )
+        assert operator.execute().pairs == [(0, 1), (0, 2), (1, 2)]
+
+    def test_url_domain_blocking(self):
+        records = [{'website': 'https://shop.acme.com'}, {'website': 'acme.com/about'}, {'website': 'globex.com'}]
+        matcher = RecordMatcher(field="website", blocking=[("url_domain", "website")], compare=lambda a, b: True)
+        assert matcher.match(records).pairs == [(0, 1)]
+
+class TestEmailMatching(unittest.TestCase):
+
+    def test_matches_email_field(self):
+        records = [
+            {'id': '1', 'email': 'Jo.Smith+news@gmail.com'},
+            {'id': '2', 'email': 'josmith@googlemail.com'},
+            {'id': '3', 'email': 'jo.smith@bigcorp.co'},
+            {'id': '4', 'email': 'Jo.Smith+crm@BigCorp.co'},
+        ]
+        operator = DataOperator(
+            field_type="email",
+            operator_type="match_condition",
+            lod=records,
+            field="email",
+            operator="matches",
+        )
+        result = operator.execute()
+        assert result.pairs == [(0, 1), (2, 3)]
+        assert result.candidate_pairs == 2
+
+    def test_email_blocking(self):
+        records = [{'email': 'jo.smith@gmail.com'}, {'email': 'JOSMITH+x@googlemail.com'}, {'email': 'pat@googlemail.com'}]
+        matcher = RecordMatcher(field="email", blocking=[("email", "email")], compare=lambda a, b: True)
+        assert matcher.match(records).pairs == [(0, 1)]
+        assert email_domain_key("pat@googlemail.com") == "gmail.com"
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from dataoperator.columnar import ColumnarRecords
+from dataoperator.dataoperator import DataOperator
+from dataoperator.merge import RecordMerger, merge_record
+
+
+LEAD_CLUSTER = [
+    {
+        'id': '00Q1',
+        'createddate': '2021-03-01T10:00:00',
+        'email': 'pat@gmail.com',
+        'numberofemployees': 10,
+        'status': 'Nurture',
+        'phone': '',
+        'hasoptedoutofemail': False,
+        'description': 'Web form',
+    },
+    {
+        'id': '00Q2',
+        'createddate': '2023-06-15T08:30:00',
+        'email': 'pat@bigcorp.co',
+        'numberofemployees': 250,
+        'status': 'Customer',
+        'phone': '555-0100',
+        'hasoptedoutofemail': True,
+        'description': '',
+    },
+    {
+        'id': '00Q3',
+        'createddate': '2019-11-20T17:45:00',
+        'email': 'pat@yahoo.com',
+        'numberofemployees': '',
+        'status': 'Prospect',
+        'phone': '555-0199',
+        'hasoptedoutofemail': False,
+        'description': 'Trade show',
+    },
+]
+
+SPEC = {
+    'numberofemployees': 'keep_max_value',
+    'phone': 'keep_newest_value',
+    'description': 'concatenate_all_values',
+    'hasoptedoutofemail': 'keep_true_value',
+    'status': {'operator': 'preserve_priority', 'value': ['Customer', 'Prospect', 'Nurture']},
+    'email': {'operator': 'keep_corporate_domain', 'field_type': 'email'},
+    'id': 'keep_oldest_value',
+}
+
+
+class TestMergeRecord(unittest.TestCase):
+
+    def test_merge_record(self):
+        record = merge_record(LEAD_CLUSTER, SPEC)
+        assert record == {
+            'id': '00Q3',
+            'createddate': '2021-03-01T10:00:00',
+            'email': 'pat@bigcorp.co',
+            'numberofemployees': 250,
+            'status': 'Customer',
+            'phone': '555-0100',
+            'hasoptedoutofemail': True,
+            'description': 'Web form|Trade show',
+        }
+
+    def test_merge_record_matches_data_operator(self):
+        field_types = {
+            'numberofemployees': 'number',
+            'phone': 'phone',
+            'description': 'text',
+            'hasoptedoutofemail': 'boolean',
+            'status': 'picklist',
+            'email': 'email',
+            'id': 'string',
+        }
+        record = merge_record(LEAD_CLUSTER, SPEC)
+        for field, config in SPEC.items():
+            if not isinstance(config, dict):
+                config = {'operator': config}
+            operator = DataOperator(
+                field_type=field_types[field],
+                operator_type='merge_values',
+                lod=LEAD_CLUSTER,
+                field=field,
+                operator=config['operator'],
+                value=config.get('value'),
+            )
+            self.assertEqual(record[field], operator.execute(), field)
+
+    def test_merge_record_does_not_modify_lod(self):
+        merge_record(LEAD_CLUSTER, SPEC)
+        assert LEAD_CLUSTER[0]['numberofemployees'] == 10
+
+    def test_merge_record_master(self):
+        record = merge_record(LEAD_CLUSTER, {'phone': 'keep_newest_value'}, master=LEAD_CLUSTER[2])
+        assert record['id'] == '00Q3'
+        assert record['phone'] == '555-0100'
+
+    def test_merge_record_datetime_field(self):
+        lod = [
+            {'name': 'John', 'updated': '2023-01-01T12:00:00'},
+            {'name': 'Jane', 'updated': '2023-01-02T12:00:00'},
+        ]
+        assert merge_record(lod, {'name': 'keep_newest_value'}, datetime_field='Updated')['name'] == 'Jane'
+
+    def test_merge_record_missing_field(self):
+        with self.assertRaises(AssertionError):
+            merge_record([{'name': 'John'}, {'age': 3}], {'name': 'concatenate_all_values'})
+
+    def test_record_merger_validates_spec(self):
+        with self.assertRaises(AssertionError):
+            RecordMerger({'age': 'keep_record_with_max_value'})
+        with self.assertRaises(AssertionError):
+            RecordMerger({'age': {'operator': 'concatenate_all_values', 'field_type': 'number'}})
+        with self.assertRaises(AssertionError):
+            RecordMerger({'status': {'operator': 'preserve_priority', 'value': 'Customer'}})
+
+    def test_record_merger_reuse(self):
+        merger = RecordMerger({'age': 'keep_min_value', 'name': 'concatenate_all_values'})
+        assert merger([{'name': 'a', 'age': 3}, {'name': 'b', 'age': 1}]) == {'name': 'a|b', 'age': 1}
+        assert merger([{'name': 'c', 'age': None}]) == {'name': 'c', 'age': None}
+
+    def test_merge_record_keep_corporate_domain_corroborated(self):
+        cluster = [
+            {'id': '1', 'email': 'pat@reseller.io', 'website': ''},
+            {'id': '2', 'email': 'pat@gmail.com', 'website': 'bigcorp.co'},
+            {'id': '3', 'email': 'pat@bigcorp.co', 'website': ''},
+        ]
+        spec = {'email': 'keep_corporate_domain'}
+        assert merge_record(cluster, spec)['email'] == 'pat@bigcorp.co'
+        assert merge_record(ColumnarRecords.from_lod(cluster), spec)['email'] == 'pat@bigcorp.co'
+        assert merge_record(cluster[1:2], spec)['email'] is None
+
+
+
+if __name__ == '__main__':
+    unittest.main()
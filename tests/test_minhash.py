@@ -0,0 +1,69 @@
+import unittest
+from unittest import mock
+from dataoperator import vectorized
+from dataoperator.minhash import (
+    LSHIndex,
+    MinHasher,
+    estimate_similarity,
+    optimal_bands,
+    shingles,
+)
+from dataoperator.normalize import canonical_company_name
+
+COMPANIES = [
+    "Acme Corp",
+    "ACME Corporation",
+    "Acme, Inc.",
+    "Globex International",
+    "Globex Internationl",
+    "Initech",
+    "Umbrella Pharmaceuticals",
+]
+
+
+class TestMinHash(unittest.TestCase):
+
+    def test_shingles(self):
+        assert shingles("acme") == {"acm", "cme"}
+        assert shingles("ab") == {"ab"}
+        assert shingles("") == set()
+
+    def test_signature(self):
+        hasher = MinHasher(num_perm=64)
+        signature = hasher.signature("globex international")
+        assert len(signature) == 64
+        assert signature == MinHasher(num_perm=64).signature("globex international")
+        assert estimate_similarity(signature, hasher.signature("globex international")) == 1.0
+        assert estimate_similarity(signature, hasher.signature("globex internationl")) > 0.6
+        assert estimate_similarity(signature, hasher.signature("initech")) < 0.2
+
+    @unittest.skipUnless(vectorized.HAS_NUMPY, "numpy is not installed")
+    def test_signature_matches_pure_python(self):
+        vectorized_signature = MinHasher().signature("umbrella pharmaceuticals")
+        with mock.patch.object(vectorized, 'HAS_NUMPY', False):
+            assert MinHasher().signature("umbrella pharmaceuticals") == vectorized_signature
+
+    def test_optimal_bands(self):
+        assert optimal_bands(0.5, 128) == (25, 5)
+        bands, rows = optimal_bands(0.8, 128)
+        assert bands * rows <= 128
+        assert rows > 5
+        with self.assertRaises(AssertionError):
+            optimal_bands(1.5, 128)
+
+    def test_lsh_index(self):
+        hasher = MinHasher()
+        index = LSHIndex(threshold=0.5)
+        for i, name in enumerate(COMPANIES):
+            index.insert(i, hasher.signature(canonical_company_name(name)))
+
+        assert index.query(hasher.signature("acme")) == {0, 1, 2}
+        assert {3, 4} <= index.query(hasher.signature("globex international"))
+        assert 5 not in index.query(hasher.signature("globex international"))
+        pairs = {(a, b) for bucket in index.buckets() for a in bucket for b in bucket if a < b}
+        assert pairs == {(0, 1), (0, 2), (1, 2), (3, 4)}
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from dataoperator import normalize
+from dataoperator.normalize import (
+    RegistrableDomainIndex,
+    canonical_company_name,
+    canonical_email,
+    canonical_host,
+    canonical_phone,
+    registrable_domain,
+)
+
+
+class TestCanonicalPhone(unittest.TestCase):
+
+    def test_nanp(self):
+        for value in ["(555) 123-4567", "+1 555 123 4567", "5551234567", "1-555-123-4567", "555.123.4567 ext. 89", "+1 (555) 123-4567 x12", 5551234567]:
+            assert canonical_phone(value) == "+15551234567", value
+
+    def test_local_number(self):
+        assert canonical_phone("555-0100") == "5550100"
+
+    def test_international(self):
+        assert canonical_phone("+44 20 7946 0958") == "+442079460958"
+        assert canonical_phone("011 44 20 7946 0958") == "+442079460958"
+        assert canonical_phone("020 7946 0958", region="GB") == "+442079460958"
+        assert canonical_phone("00 44 20 7946 0958", region="DE") == "+442079460958"
+        assert canonical_phone("0412 345 678", region="AU") == "+61412345678"
+
+    def test_parenthesized_trunk_prefix(self):
+        assert canonical_phone("+44 (0)20 7946 0958") == "+442079460958"
+        assert canonical_phone("+44(0)2079460958") == "+442079460958"
+        assert canonical_phone("+49 (0) 30 123456") == "+4930123456"
+
+    def test_numeric_values(self):
+        assert canonical_phone(5551234567) == "+15551234567"
+        assert canonical_phone(5551234567.0) == "+15551234567"
+
+    def test_national_number_of_another_region(self):
+        assert canonical_phone("020 7946 0958") is None
+        assert canonical_phone("+020 7946 0958") is None
+
+    def test_blank_and_invalid(self):
+        assert canonical_phone("") is None
+        assert canonical_phone(None) is None
+        assert canonical_phone("555-01") is None
+        assert canonical_phone("+1 555 123 4567 890 123 456 789") is None
+        with self.assertRaises(AssertionError):
+            canonical_phone("5551234567", region="XX")
+
+    def test_memoized(self):
+        canonical_phone("(555) 123-4567")
+        info = normalize._canonical_phone.cache_info()
+        canonical_phone("(555) 123-4567")
+        assert normalize._canonical_phone.cache_info().hits == info.hits + 1
+        assert info.maxsize == normalize.NORMALIZE_CACHE_SIZE
+
+class TestCanonicalUrl(unittest.TestCase):
+
+    def test_canonical_host(self):
+        for value in ["https://www.Acme.com/", "acme.com", "http://acme.com/about", "//acme.com", "https://user:pw@ACME.com:8443/x?y=1#z", "acme.com."]:
+            assert canonical_host(value) == "acme.com", value
+        assert canonical_host("https://shop.acme.com") == "shop.acme.com"
+        assert canonical_host("pat@acme.com") == "acme.com"
+        assert canonical_host("https://bücher.de") == "xn--bcher-kva.de"
+        assert canonical_host("Acme Inc") is None
+        assert canonical_host("localhost") is None
+        assert canonical_host(None) is None
+
+    def test_registrable_domain(self):
+        assert registrable_domain("https://www.Acme.com/") == "acme.com"
+        assert registrable_domain("http://shop.eu.acme.com/about") == "acme.com"
+        assert registrable_domain("https://www.acme.co.uk") == "acme.co.uk"
+        assert registrable_domain("mail.acme.co.uk") == "acme.co.uk"
+        assert registrable_domain("acme.github.io") == "acme.github.io"
+        assert registrable_domain("co.uk") is None
+        assert registrable_domain("") is None
+
+    def test_registrable_domain_index(self):
+        accounts = [
+            {"id": "001", "website": "https://www.acme.com"},
+            {"id": "002", "website": "acme.co.uk"},
+            {"id": "003", "website": "http://shop.acme.com/store"},
+            {"id": "004", "website": ""},
+        ]
+        index = RegistrableDomainIndex.from_records(accounts, "website")
+        assert len(index) == 2
+        assert index.get("acme.com/about") == ["001", "003"]
+        assert index.get("https://www.acme.co.uk/") == ["002"]
+        assert index.get("globex.com") == []
+        assert index.get(None) == []
+        assert "http://acme.com" in index
+        assert "globex.com" not in index
+
+class TestCanonicalEmail(unittest.TestCase):
+
+    def test_canonical_email(self):
+        for value in ["Jo.Smith+news@GoogleMail.com", "josmith@gmail.com", " jo.smith@gmail.com ", "j.o.s.m.i.t.h+a+b@gmail.com"]:
+            assert canonical_email(value) == "josmith@gmail.com", value
+        assert canonical_email("Jo.Smith+crm@BigCorp.co") == "jo.smith@bigcorp.co"
+        assert canonical_email("pat@me.com") == canonical_email("pat@mac.com") == "pat@icloud.com"
+
+    def test_invalid(self):
+        assert canonical_email("not-an-email") is None
+        assert canonical_email("+tag@gmail.com") is None
+        assert canonical_email("pat@") is None
+        assert canonical_email("") is None
+        assert canonical_email(None) is None
+
+    def test_memoized(self):
+        canonical_email("Pat+x@BigCorp.co")
+        info = normalize._canonical_email.cache_info()
+        canonical_email("Pat+x@BigCorp.co")
+        assert normalize._canonical_email.cache_info().hits == info.hits + 1
+
+
+
+
+class TestCanonicalCompanyName(unittest.TestCase):
+
+    def test_canonical_company_name(self):
+        assert canonical_company_name("Acme Corp") == "acme"
+        assert canonical_company_name("ACME Corporation") == "acme"
+        assert canonical_company_name("Acme, Inc.") == "acme"
+        assert canonical_company_name("Acme L.L.C.") == "acme"
+        assert canonical_company_name("Acme & Co") == "acme"
+        assert canonical_company_name("Smith & Sons Co. Ltd") == "smith and sons"
+        # suffixes are whole words; a legal suffix on its own is kept
+        assert canonical_company_name("Big-Corp") == "big corp"
+        assert canonical_company_name("Company") == "company"
+
+    def test_invalid(self):
+        assert canonical_company_name("") is None
+        assert canonical_company_name(" - ") is None
+        assert canonical_company_name(None) is None
+
+
+if __name__ == '__main__':
+    unittest.main()
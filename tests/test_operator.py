@@ -1,5 +1,5 @@
 import unittest
-from dataoperator.dataoperator import DataOperator
+from dataoperator.dataoperator import DataOperator, select_corporate_email
 
 # account
 REAL_LOD_A = [
@@ -1645,6 +1645,455 @@ class TestDataOperator(unittest.TestCase):
         self.assertEqual(result[1]["industry"], "Finance")
         self.assertEqual(result[2]["industry"], "Healthcare")
 
+    def test_compile_applies_operator_to_many_lods(self):
+        keep_max = DataOperator.compile("number", "merge_values", "keep_max_value", "Age")
+        assert keep_max([{"age": 30}, {"age": 35}]) == 35
+        assert keep_max([{"age": 1}, {"age": None}]) == 1
+
+    def test_compile_matches_execute(self):
+        lod = [
+            {"name": "John", "created_at": "2023-01-01T12:00:00"},
+            {"name": "Jane", "created_at": "2023-01-02T12:00:00"}
+        ]
+        compiled = DataOperator.compile("string", "merge_values", "keep_newest_value", "name")
+        operator = DataOperator(
+            field_type="string",
+            operator_type="merge_values",
+            lod=lod,
+            field="name",
+            operator="keep_newest_value"
+        )
+        self.assertEqual(compiled(lod), operator.execute())
+
+    def test_compile_validates_configuration(self):
+        with self.assertRaises(AssertionError):
+            DataOperator.compile("number", "merge_values", "concatenate_all_values", "age")
+        with self.assertRaises(AssertionError):
+            DataOperator.compile("string", "update_field", "overwrite", "name")
+        with self.assertRaises(AssertionError):
+            DataOperator.compile("string", "merge_values", "concatenate_all_values", "name", lod=[{"name": "Joe"}])
+
+    def test_compile_evaluate_condition_requires_single_record(self):
+        equals = DataOperator.compile("string", "evaluate_condition", "equals", "name", value="Joe")
+        assert equals([{"name": "Joe"}]) == True
+        with self.assertRaises(AssertionError):
+            equals([{"name": "Joe"}, {"name": "Jane"}])
+
+    def test_get_methods_matches_method_lists(self):
+        operator = DataOperator(
+            field_type="int",
+            operator_type="select_master_record"
+        )
+        assert operator.get_methods() == ['keep_record_by_criteria', 'keep_record_with_max_value', 'keep_record_with_min_value']
+
+    def test_get_methods_excludes_unimplemented_methods(self):
+        operator = DataOperator(
+            field_type="date",
+            operator_type="select_master_record"
+        )
+        assert 'keep_record_with_highest_priority' not in operator.get_methods()
+        assert operator.get_methods() == ['keep_record_by_criteria', 'keep_record_with_newest_value', 'keep_record_with_oldest_value']
+
+    def test_execute_dispatches_to_subclass_methods(self):
+        class ShoutingOperator(DataOperator):
+            def concatenate_all_values(self):
+                return super().concatenate_all_values().upper()
+
+        operator = ShoutingOperator(
+            field_type="string",
+            operator_type="merge_values",
+            lod=[{"name": "John"}, {"name": "Jane"}],
+            field="name",
+            operator="concatenate_all_values"
+        )
+        assert operator.execute() == "JOHN|JANE"
+        assert DataOperator._dispatch_table['concatenate_all_values'] is not ShoutingOperator._dispatch_table['concatenate_all_values']
+
+    def test_init_invalid_validation(self):
+        with self.assertRaises(AssertionError):
+            DataOperator(
+                field_type="number",
+                operator_type="merge_values",
+                validation="sometimes"
+            )
+
+    def test_init_trusted_validation_skips_record_checks(self):
+        lod = [{"age": 30}, {"name": "Jane"}]
+        operator = DataOperator(
+            field_type="number",
+            operator_type="merge_values",
+            lod=lod,
+            field="age",
+            operator="keep_max_value",
+            validation="trusted"
+        )
+        assert operator.validation == "trusted"
+
+    def test_trusted_validation_reports_missing_field_on_execute(self):
+        operator = DataOperator(
+            field_type="number",
+            operator_type="merge_values",
+            lod=[{"age": 30}, {"name": "Jane"}],
+            field="age",
+            operator="keep_max_value",
+            validation="trusted"
+        )
+        with self.assertRaisesRegex(AssertionError, "Field 'age' not found in all dictionaries"):
+            operator.execute()
+
+    def test_sampled_validation_checks_small_lods_fully(self):
+        with self.assertRaises(AssertionError):
+            DataOperator(
+                field_type="number",
+                operator_type="merge_values",
+                lod=[{"age": 30}, {"name": "Jane"}],
+                field="age",
+                operator="keep_max_value",
+                validation="sampled"
+            )
+
+    def test_sampled_validation_bounds_checked_records(self):
+        lod = [{"age": i} for i in range(1000)]
+        operator = DataOperator(
+            field_type="number",
+            operator_type="merge_values",
+            lod=lod,
+            field="age",
+            operator="keep_max_value",
+            validation="sampled"
+        )
+        assert operator.execute() == 999
+
+    def test_compile_validation_level(self):
+        keep_max = DataOperator.compile("number", "merge_values", "keep_max_value", "age", validation="strict")
+        with self.assertRaises(AssertionError):
+            keep_max([{"age": 30}, {"name": "Jane"}])
+
+        keep_max = DataOperator.compile("number", "merge_values", "keep_max_value", "age")
+        with self.assertRaisesRegex(AssertionError, "not found in all dictionaries"):
+            keep_max([{"age": 30}, {"name": "Jane"}])
+
+    def test_execute_many_returns_results_in_order(self):
+        operator = DataOperator(
+            field_type="number",
+            operator_type="merge_values",
+            field="age",
+            operator="keep_max_value"
+        )
+        clusters = [
+            [{"age": 30}, {"age": 35}],
+            [{"age": 1}],
+            [{"age": 7}, {"age": 3}, {"age": None}],
+        ]
+        assert operator.execute_many(clusters) == [35, 1, 7]
+
+    def test_iter_execute_is_lazy(self):
+        keep_newest = DataOperator.compile("string", "merge_values", "keep_newest_value", "name")
+        clusters = (
+            [{"name": name, "createddate": createddate} for name, createddate in cluster]
+            for cluster in [
+                [("John", "2023-01-01T12:00:00"), ("Jane", "2023-01-02T12:00:00")],
+                [("Bob", "2022-01-01T12:00:00"), ("Al", "2021-01-02T12:00:00")],
+            ]
+        )
+        results = keep_newest.iter_execute(clusters)
+        assert next(results) == "Jane"
+        assert next(results) == "Bob"
+        with self.assertRaises(StopIteration):
+            next(results)
+
+    def test_execute_many_detects_datetime_field_once(self):
+        keep_oldest = DataOperator.compile("string", "merge_values", "keep_oldest_value", "name")
+        clusters = [
+            [{"name": "John", "created_at": "2023-01-01T12:00:00"}, {"name": "Jane", "created_at": "2023-01-02T12:00:00"}],
+            [{"name": "Bob", "created_at": "2022-01-01T12:00:00"}, {"name": "Al", "created_at": "2021-01-02T12:00:00"}],
+        ]
+        assert keep_oldest.execute_many(clusters) == ["John", "Al"]
+
+    def test_execute_many_validates_each_cluster(self):
+        operator = DataOperator(
+            field_type="number",
+            operator_type="merge_values",
+            field="age",
+            operator="keep_max_value"
+        )
+        with self.assertRaises(AssertionError):
+            operator.execute_many([[{"age": 30}], [{"name": "Jane"}]])
+
+    def test_keep_record_by_criteria_first_criterion(self):
+        lod = [
+            {"id": "1", "numberofemployees": 25, "lastmodifieddate": "2025-01-01T00:00:00"},
+            {"id": "2", "numberofemployees": 300, "lastmodifieddate": "2024-01-01T00:00:00"},
+            {"id": "3", "numberofemployees": "", "lastmodifieddate": "2026-01-01T00:00:00"},
+        ]
+        operator = DataOperator(
+            field_type="number",
+            operator_type="select_master_record",
+            lod=lod,
+            field="numberofemployees",
+            operator="keep_record_by_criteria",
+            value=[{"rule": "max"}, {"field": "lastmodifieddate", "rule": "newest"}]
+        )
+        assert operator.execute() == [lod[1]]
+
+    def test_keep_record_by_criteria_tie_breakers(self):
+        lod = [
+            {"id": "1", "numberofemployees": 300, "lastmodifieddate": "2024-01-01T00:00:00", "leadsource": "Web"},
+            {"id": "2", "numberofemployees": 300, "lastmodifieddate": "2025-01-01T00:00:00", "leadsource": "Web"},
+            {"id": "3", "numberofemployees": 300, "lastmodifieddate": "2025-01-01T00:00:00", "leadsource": "Partner"},
+            {"id": "4", "numberofemployees": 10, "lastmodifieddate": "2026-01-01T00:00:00", "leadsource": "Partner"},
+        ]
+        operator = DataOperator(
+            field_type="number",
+            operator_type="select_master_record",
+            lod=lod,
+            field="numberofemployees",
+            operator="keep_record_by_criteria",
+            value=[
+                {"rule": "max"},
+                {"field": "LastModifiedDate", "rule": "newest"},
+                {"field": "leadsource", "rule": "priority", "value": ["Partner", "Web"]},
+            ]
+        )
+        records = operator.execute()
+        assert len(records) == 1
+        assert records[0]["id"] == "3"
+
+    def test_keep_record_by_criteria_min_and_oldest(self):
+        lod = [
+            {"id": "1", "createddate": "2020-01-01T00:00:00+05:00", "score": 2},
+            {"id": "2", "createddate": "2020-01-01T00:00:00", "score": 2},
+            {"id": "3", "createddate": "", "score": 1},
+        ]
+        operator = DataOperator(
+            field_type="datetime",
+            operator_type="select_master_record",
+            lod=lod,
+            field="createddate",
+            operator="keep_record_by_criteria",
+            value=[{"rule": "oldest"}, {"field": "score", "rule": "min"}]
+        )
+        assert operator.execute()[0]["id"] == "1"
+
+    def test_keep_record_by_criteria_full_tie_keeps_first(self):
+        lod = [{"id": "1", "status": "Open"}, {"id": "2", "status": "Open"}]
+        operator = DataOperator(
+            field_type="picklist",
+            operator_type="select_master_record",
+            lod=lod,
+            field="status",
+            operator="keep_record_by_criteria",
+            value=[{"rule": "priority", "value": ["Closed", "Open"]}]
+        )
+        assert operator.execute() == [lod[0]]
+
+    def test_keep_record_by_criteria_invalid_criteria(self):
+        lod = [{"id": "1", "status": "Open"}]
+        for value in (None, [], [{"rule": "biggest"}], [{"rule": "priority", "value": "Open"}]):
+            with self.assertRaises(AssertionError):
+                DataOperator(
+                    field_type="picklist",
+                    operator_type="select_master_record",
+                    lod=lod,
+                    field="status",
+                    operator="keep_record_by_criteria",
+                    value=value
+                )
+
+    def test_keep_corporate_domain_skips_disposable_domains(self):
+        lod = [
+            {"id": "001", "email": "jose.conseco@mailinator.com"},
+            {"id": "002", "email": "jose.conseco@bigcorp.co"},
+        ]
+        operator = DataOperator(
+            field_type="email",
+            lod=lod,
+            field="email",
+            operator_type="merge_values",
+            operator="keep_corporate_domain"
+        )
+        assert operator.execute() == "jose.conseco@bigcorp.co"
+
+    def test_keep_corporate_domain_tenant_overlay(self):
+        from dataoperator.email_domains import remove_tenant_overlay, set_tenant_overlay
+        lod = [
+            {"id": "001", "email": "jose.conseco@yahoo.co.uk"},
+            {"id": "002", "email": "jose.conseco@bigcorp.co"},
+        ]
+        set_tenant_overlay("acme", allow=["yahoo.co.uk"])
+        try:
+            operator = DataOperator(
+                field_type="email",
+                lod=lod,
+                field="email",
+                operator_type="merge_values",
+                operator="keep_corporate_domain",
+                tenant="acme"
+            )
+            assert operator.execute() == "jose.conseco@yahoo.co.uk"
+        finally:
+            remove_tenant_overlay("acme")
+
+    def test_keep_corporate_domain_corroborated_by_website(self):
+        lod = [
+            {"id": "001", "email": "pat@reseller.io", "website": ""},
+            {"id": "002", "email": "pat@bigcorp.co", "website": "https://www.BigCorp.co/about"},
+        ]
+        operator = DataOperator(
+            field_type="email",
+            lod=lod,
+            field="email",
+            operator_type="merge_values",
+            operator="keep_corporate_domain"
+        )
+        assert operator.execute() == "pat@bigcorp.co"
+
+    def test_keep_corporate_domain_corroborated_by_company(self):
+        lod = [
+            {"id": "001", "email": "pat@reseller.io", "company": "Big-Corp"},
+            {"id": "002", "email": "pat@mail.bigcorp.co", "company": "Big-Corp"},
+        ]
+        operator = DataOperator(
+            field_type="email",
+            lod=lod,
+            field="email",
+            operator_type="merge_values",
+            operator="keep_corporate_domain"
+        )
+        assert operator.execute() == "pat@mail.bigcorp.co"
+
+    def test_keep_corporate_domain_corroborated_by_company_with_legal_suffix(self):
+        lod = [
+            {"id": "001", "email": "x@other.com", "company": "Acme Inc"},
+            {"id": "002", "email": "y@acme.com", "company": "Acme, Inc."},
+        ]
+        assert select_corporate_email(lod, "email") == "y@acme.com"
+        operator = DataOperator(
+            field_type="email",
+            lod=lod,
+            field="email",
+            operator_type="merge_values",
+            operator="keep_corporate_domain"
+        )
+        assert operator.execute() == "y@acme.com"
+
+    def test_keep_corporate_domain_without_signal_keeps_first(self):
+        lod = [
+            {"id": "001", "email": "pat@reseller.io", "website": "example.org"},
+            {"id": "002", "email": "pat@bigcorp.co", "website": ""},
+        ]
+        operator = DataOperator(
+            field_type="email",
+            lod=lod,
+            field="email",
+            operator_type="merge_values",
+            operator="keep_corporate_domain"
+        )
+        assert operator.execute() == "pat@reseller.io"
+
+    def test_keep_corporate_domain_without_candidates(self):
+        lod = [
+            {"id": "001", "email": "pat@gmail.com"},
+            {"id": "002", "email": ""},
+        ]
+        operator = DataOperator(
+            field_type="email",
+            lod=lod,
+            field="email",
+            operator_type="merge_values",
+            operator="keep_corporate_domain"
+        )
+        assert operator.execute() is None
+
+    def test_phone_equals_canonical(self):
+        lod = [{"id": "001", "phone": "(555) 123-4567"}]
+        for operator_name, value, expected in [
+            ("equals", "+1 555 123 4567", True),
+            ("equals", "5551234567", True),
+            ("equals", "5551234568", False),
+            ("not_equals", "1-555-123-4567", False),
+            ("contains", "123-4567", True),
+            ("contains", "555", True),
+            ("not_contains", "999-0000", True),
+        ]:
+            operator = DataOperator(
+                field_type="phone",
+                operator_type="evaluate_condition",
+                lod=lod,
+                field="phone",
+                operator=operator_name,
+                value=value
+            )
+            assert operator.execute() == expected, (operator_name, value)
+
+    def test_url_equals_registrable_domain(self):
+        lod = [{"id": "001", "website": "https://www.Acme.com/"}]
+        for operator_name, value, expected in [
+            ("equals", "acme.com", True),
+            ("equals", "http://acme.com/about", True),
+            ("equals", "acme.co.uk", False),
+            ("not_equals", "http://shop.acme.com", False),
+            ("contains", "acme", True),
+        ]:
+            operator = DataOperator(
+                field_type="url",
+                operator_type="evaluate_condition",
+                lod=lod,
+                field="website",
+                operator=operator_name,
+                value=value
+            )
+            assert operator.execute() == expected, (operator_name, value)
+
+    def test_url_contains_compares_raw_values(self):
+        for website, operator_name, value, expected in [
+            ("https://acme.com/about", "contains", "acme.com/pricing", False),
+            ("https://acme.com/about", "contains", "ACME.com/about", True),
+            ("https://shop.acme.com", "not_contains", "blog.acme.com", True),
+            ("https://shop.acme.com", "not_contains", "shop.acme", False),
+        ]:
+            operator = DataOperator(
+                field_type="url",
+                operator_type="evaluate_condition",
+                lod=[{"id": "001", "website": website}],
+                field="website",
+                operator=operator_name,
+                value=value
+            )
+            assert operator.execute() == expected, (website, operator_name, value)
+
+    def test_keep_corporate_domain_corroborated_by_registrable_domain(self):
+        lod = [
+            {"id": "001", "email": "pat@reseller.co.uk", "website": ""},
+            {"id": "002", "email": "pat@mail.bigcorp.co.uk", "website": "https://shop.bigcorp.co.uk"},
+        ]
+        operator = DataOperator(
+            field_type="email",
+            lod=lod,
+            field="email",
+            operator_type="merge_values",
+            operator="keep_corporate_domain"
+        )
+        assert operator.execute() == "pat@mail.bigcorp.co.uk"
+
+    def test_email_equals_canonical(self):
+        lod = [{"id": "001", "email": "Jose.Conseco+news@gmail.com"}]
+        for operator_name, value, expected in [
+            ("equals", "joseconseco@googlemail.com", True),
+            ("equals", "jose.conseco@gmail.com", True),
+            ("equals", "jose.conseco@bigcorp.co", False),
+            ("not_equals", "JOSECONSECO@gmail.com", False),
+        ]:
+            operator = DataOperator(
+                field_type="email",
+                operator_type="evaluate_condition",
+                lod=lod,
+                field="email",
+                operator=operator_name,
+                value=value
+            )
+            assert operator.execute() == expected, (operator_name, value)
+
 
 
 if __name__ == '__main__':
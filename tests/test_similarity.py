@@ -0,0 +1,97 @@
+import unittest
+from unittest import mock
+from dataoperator import vectorized
+from dataoperator.similarity import (
+    email_similarities,
+    jaro_winkler,
+    levenshtein_similarity,
+    levenshtein_within,
+    phone_similarities,
+    similarities,
+    string_similarities,
+    url_similarities,
+)
+
+
+class TestSimilarity(unittest.TestCase):
+
+    def test_levenshtein_within(self):
+        assert levenshtein_within("kitten", "sitting", 3) == 3
+        assert levenshtein_within("kitten", "sitting", 2) is None
+        assert levenshtein_within("flaw", "lawn", 2) == 2
+        assert levenshtein_within("", "abc", 3) == 3
+        assert levenshtein_within("abc", "abcdefgh", 2) is None
+        assert levenshtein_within("same", "same", 0) == 0
+
+    def test_levenshtein_matches_full_dp(self):
+        def full(a, b):
+            previous = list(range(len(b) + 1))
+            for i, x in enumerate(a, 1):
+                current = [i]
+                for j, y in enumerate(b, 1):
+                    current.append(min(previous[j - 1] + (x != y), previous[j] + 1, current[j - 1] + 1))
+                previous = current
+            return previous[-1]
+
+        words = ["acme", "acmee", "amce", "globex", "glbex", "initech", "", "a", "umbrella corp"]
+        for a in words:
+            for b in words:
+                distance = full(a, b)
+                for max_distance in range(0, 6):
+                    expected = distance if distance <= max_distance else None
+                    assert levenshtein_within(a, b, max_distance) == expected, (a, b, max_distance)
+
+    def test_jaro_winkler(self):
+        assert round(jaro_winkler("martha", "marhta"), 3) == 0.961
+        assert round(jaro_winkler("dwayne", "duane"), 3) == 0.84
+        assert round(jaro_winkler("dixon", "dicksonx"), 3) == 0.813
+        assert jaro_winkler("acme", "acme") == 1.0
+        assert jaro_winkler("", "") == 0.0
+        assert jaro_winkler("dwayne", "duane", threshold=0.9) == 0.0
+
+    def test_levenshtein_similarity(self):
+        assert levenshtein_similarity("kitten", "sitting") == 1 - 3 / 7
+        assert levenshtein_similarity("kitten", "sitting", threshold=0.6) == 0.0
+
+    def test_similarities_length_bound(self):
+        # "a" vs a long string can't reach the threshold, so it is never scored
+        with mock.patch('dataoperator.similarity.jaro_winkler') as score:
+            with mock.patch.dict('dataoperator.similarity._METRICS', {'jaro_winkler': score}):
+                similarities(["a"], ["abcdefghijklmnop"], threshold=0.9)
+        score.assert_not_called()
+
+    def test_similarities_numpy_matches_pure_python(self):
+        left = ["acme corp", "globex", "", None, "initech", "a"] * 50
+        right = ["acme corporation", "glbex", "x", "y", "initech", "abcdefghijkl"] * 50
+        for metric in ["jaro_winkler", "levenshtein"]:
+            scores = similarities(left, right, 0.7, metric)
+            with mock.patch.object(vectorized, 'HAS_NUMPY', False):
+                assert similarities(left, right, 0.7, metric) == scores
+
+    def test_string_similarities(self):
+        scores = string_similarities(["Acme Corp", "Globex", None], ["ACME CORP ", "Initech", "Acme"], threshold=0.8)
+        assert scores == [1.0, 0.0, 0.0]
+
+    def test_email_similarities(self):
+        scores = email_similarities(
+            ["jon.smith@bigcorp.co", "jon.smith@bigcorp.co", "not-an-email"],
+            ["Jon.Smiht@BigCorp.co", "jon.smith@gmail.com", "not-an-email"],
+            threshold=0.9,
+        )
+        assert scores[0] > 0.9
+        assert scores[1:] == [0.0, 0.0]
+
+    def test_phone_similarities(self):
+        scores = phone_similarities(["(415) 555-0100", "415-555-0100", ""], ["+1 415.555.0100", "415-555-0199", ""], threshold=0.8)
+        # canonical keys include the country code: 2 edits in 11 digits
+        assert scores == [1.0, 1 - 2 / 11, 0.0]
+
+    def test_url_similarities(self):
+        scores = url_similarities(["https://www.Acme.com/about", "acme.com"], ["http://acme.com", "acme.co"], threshold=0.8)
+        assert scores[0] == 1.0
+        assert scores[1] == 1 - 1 / 8
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+
+from dataoperator import timestamps
+from dataoperator.dataoperator import DataOperator
+from dataoperator.merge import merge_record
+from dataoperator.timestamps import TimestampCache, to_epoch_microseconds
+
+
+class TestTimestampCache(unittest.TestCase):
+
+    def test_to_epoch_microseconds(self):
+        assert to_epoch_microseconds("1970-01-01T00:00:01") == 1000000
+        assert to_epoch_microseconds("1970-01-01T01:00:00+01:00") == 0
+        assert to_epoch_microseconds("2023-01-01T12:00:00.5") > to_epoch_microseconds("2023-01-01T12:00:00")
+
+    def test_parse_is_cached(self):
+        cache = TimestampCache()
+        with mock.patch.object(timestamps, "to_epoch_microseconds", wraps=to_epoch_microseconds) as parse:
+            assert cache.parse("2023-01-01T12:00:00") == cache.parse("2023-01-01T12:00:00")
+            assert parse.call_count == 1
+
+    def test_parse_is_bounded(self):
+        cache = TimestampCache(maxsize=2)
+        for day in range(1, 6):
+            cache.parse(f"2023-01-0{day}T12:00:00")
+        assert len(cache) == 2
+
+    def test_column(self):
+        cache = TimestampCache()
+        lod = [{"created_at": "1970-01-01T00:00:01"}, {"created_at": ""}, {"created_at": None}]
+        assert cache.column(lod, "created_at") == [1000000, None, None]
+        assert cache.column(lod, "created_at") is cache.column(lod, "created_at")
+
+    def test_column_is_bounded(self):
+        cache = TimestampCache(max_columns=1)
+        first = [{"created_at": "1970-01-01T00:00:01"}]
+        second = [{"created_at": "1970-01-01T00:00:02"}]
+        first_column = cache.column(first, "created_at")
+        cache.column(second, "created_at")
+        assert cache.column(first, "created_at") is not first_column
+
+    def test_update_field_invalidates_column(self):
+        cache = TimestampCache()
+        lod = [
+            {"name": "John", "created_at": "2023-01-01T12:00:00"},
+            {"name": "Jane", "created_at": "2023-01-02T12:00:00"},
+        ]
+        newest = DataOperator.compile("datetime", "select_master_record", "keep_record_with_newest_value", "created_at", timestamp_cache=cache)
+        assert newest(lod)[0]["name"] == "Jane"
+
+        DataOperator(
+            field_type="string",
+            operator_type="update_field",
+            lod=lod[:1],
+            field="created_at",
+            operator="overwrite",
+            value="2024-01-01T12:00:00",
+            timestamp_cache=cache
+        ).execute()
+        # lod[:1] is a different list, but the records (and so the cached column) are shared
+        assert newest(lod)[0]["name"] == "John"
+
+    def test_operators_share_cache(self):
+        cache = TimestampCache()
+        lod = [
+            {"name": "John", "age": 30, "createddate": "2023-01-01T12:00:00"},
+            {"name": "Jane", "age": 25, "createddate": "2023-01-02T12:00:00"},
+        ]
+        with mock.patch.object(timestamps, "to_epoch_microseconds", wraps=to_epoch_microseconds) as parse:
+            for field, expected in (("name", "Jane"), ("age", 25)):
+                operator = DataOperator(
+                    field_type="string" if field == "name" else "number",
+                    operator_type="merge_values",
+                    lod=lod,
+                    field=field,
+                    operator="keep_newest_value",
+                    timestamp_cache=cache
+                )
+                assert operator.execute() == expected
+            assert merge_record(lod, {"name": "keep_oldest_value"}, timestamp_cache=cache)["name"] == "John"
+            assert parse.call_count == 2
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+
+from dataoperator import vectorized
+from dataoperator.dataoperator import DataOperator
+
+
+def _lod(size):
+    lod = [
+        {"id": str(i), "created_at": f"20{10 + i % 10}-0{1 + i % 9}-1{i % 10}T0{i % 10}:00:00" if i % 7 else ""}
+        for i in range(size)
+    ]
+    lod[3]["created_at"] = "2019-09-19T09:00:00"
+    lod[5]["created_at"] = "2019-09-19T09:00:00"
+    lod[8]["created_at"] = "2010-01-01T00:00:00+01:00"
+    return lod
+
+
+@unittest.skipUnless(vectorized.HAS_NUMPY, "numpy is not installed")
+class TestVectorized(unittest.TestCase):
+
+    def test_to_datetime64_blanks_are_nat(self):
+        column = vectorized.to_datetime64(["2020-01-01T00:00:00", "", None])
+        assert str(column.dtype) == "datetime64[us]"
+        assert vectorized._numpy().isnat(column).tolist() == [False, True, True]
+
+    def test_to_datetime64_converts_offsets_to_utc(self):
+        column = vectorized.to_datetime64(["2020-01-01T05:00:00+05:00", "2020-01-01T00:00:00"])
+        assert column[0] == column[1]
+
+    def test_extreme_datetime_indexes(self):
+        values = ["2020-01-01T00:00:00", "", "2021-01-01T00:00:00", "2021-01-01T00:00:00", None]
+        assert vectorized.extreme_datetime_indexes(values, newest=True) == [2, 3]
+        assert vectorized.extreme_datetime_indexes(values, newest=False) == [0]
+
+    def test_extreme_datetime_indexes_all_blank(self):
+        with self.assertRaises(ValueError):
+            vectorized.extreme_datetime_indexes(["", None], newest=True)
+
+    def test_operator_matches_pure_python_path(self):
+        lod = _lod(vectorized.VECTORIZE_MIN_RECORDS * 2)
+        for operator_name in ("keep_record_with_newest_value", "keep_record_with_oldest_value"):
+            operator = DataOperator(
+                field_type="datetime",
+                operator_type="select_master_record",
+                lod=lod,
+                field="created_at",
+                operator=operator_name
+            )
+            with mock.patch.object(vectorized, "extreme_datetime_indexes", wraps=vectorized.extreme_datetime_indexes) as kernel:
+                vectorized_result = operator.execute()
+                assert kernel.called
+            with mock.patch.object(vectorized, "HAS_NUMPY", False):
+                assert operator.execute() == vectorized_result, operator_name
+
+    def test_to_datetime64_rejects_values_the_pure_python_path_rejects(self):
+        for value in [2020, "2020", "2020-01", "20200101", True]:
+            with self.assertRaises(ValueError, msg=repr(value)):
+                vectorized.to_datetime64(["2020-01-01T00:00:00", value])
+
+    def test_operator_unsupported_values_fail_like_pure_python_path(self):
+        size = vectorized.VECTORIZE_MIN_RECORDS + 44
+        mixed = [{"id": str(i), "d": i if i % 2 else "2020"} for i in range(size)]
+        for lod, error in [
+            # "2020" is the first value, so both paths report it first
+            (mixed, ValueError),
+            ([{"id": str(i), "d": i} for i in range(size)], TypeError),
+            ([{"id": str(i), "d": "2020"} for i in range(size)], ValueError),
+        ]:
+            for records in (lod, lod[:10]):
+                operator = DataOperator(
+                    field_type="datetime",
+                    operator_type="select_master_record",
+                    lod=records,
+                    field="d",
+                    operator="keep_record_with_newest_value"
+                )
+                with self.assertRaises(error):
+                    operator.execute()
+
+
+
+if __name__ == '__main__':
+    unittest.main()